@@ -8,6 +8,8 @@ run_recorder.py._patch_data_recorder_setting_path() 的公共逻辑。
 """
 import logging
 import os
+import tempfile
+import uuid
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,92 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """
+    原子写入文本文件，读者只会看到旧内容或完整新内容。
+
+    Linux 下使用 O_TMPFILE 匿名 inode 写入，写完后才通过 /proc/self/fd 链接成
+    目录项再 os.replace 到目标路径，崩溃时不会遗留 .tmp 文件；
+    其他平台退回同目录临时文件 + os.replace。
+
+    替换前 fsync 文件数据、替换后 fsync 父目录，避免延迟分配下
+    崩溃得到零长度文件。
+    """
+    data = text.encode("utf-8")
+    directory = str(path.parent)
+
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is not None:
+        try:
+            fd = os.open(directory, o_tmpfile | os.O_WRONLY, 0o644)
+        except OSError:
+            fd = None
+        if fd is not None:
+            # pid + uuid 保证并发写入（多线程/多进程）时链接名互不冲突
+            link_path = os.path.join(
+                directory, f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+            )
+            try:
+                # os.write 可能短写，循环直至全部写入
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+                os.link(f"/proc/self/fd/{fd}", link_path, follow_symlinks=True)
+                linked = True
+            except OSError:
+                # 文件系统不支持 linkat 匿名 inode 时走下方通用路径
+                linked = False
+            finally:
+                os.close(fd)
+            if linked:
+                try:
+                    os.replace(link_path, path)
+                except OSError:
+                    os.unlink(link_path)
+                    raise
+                _fsync_directory(directory)
+                return
+
+    # NamedTemporaryFile 以 O_CREAT | O_EXCL 创建唯一文件名
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=directory, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(data)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+    try:
+        # NamedTemporaryFile 固定以 0600 创建，与 O_TMPFILE 分支保持一致的 0644
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, path)
+    except OSError:
+        os.remove(tmp.name)
+        raise
+    _fsync_directory(directory)
+
+
+def _file_size(path: Path) -> int | None:
+    """单次 stat 获取文件大小，文件不存在时返回 None。"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_directory(directory: str) -> None:
+    """fsync 目录使 rename 持久化；不支持打开目录的平台（Windows）直接跳过。"""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def patch_data_recorder_setting_path() -> None:
     """
     将 VnPy 的 data_recorder_setting.json 路径重定向到运行时目录。
@@ -54,16 +142,15 @@ def patch_data_recorder_setting_path() -> None:
         try:
             with open(toml_path, "rb") as f:
                 toml_data = tomllib.load(f)
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(toml_data, f, ensure_ascii=False, indent=2)
+            _atomic_write_text(json_path, json.dumps(toml_data, ensure_ascii=False, indent=2))
             logger.info(f"已从 TOML 转换配置: {toml_path} -> {json_path}")
         except Exception as e:
             logger.error(f"转换 TOML 配置失败: {e}")
-            if not json_path.exists():
-                json_path.write_text("{}", encoding="utf-8")
-    elif not json_path.exists() or json_path.stat().st_size == 0:
+            if _file_size(json_path) is None:
+                _atomic_write_text(json_path, "{}")
+    elif not _file_size(json_path):
         # 如果 TOML 和 JSON 都不存在，创建空 JSON
-        json_path.write_text("{}", encoding="utf-8")
+        _atomic_write_text(json_path, "{}")
 
     def patched_get_file_path(filename: str):
         if filename == "data_recorder_setting.json":
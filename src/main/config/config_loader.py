@@ -11,7 +11,7 @@ import sys
 import copy
 import importlib
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from src.strategy.runtime.registry import CAPABILITY_KEYS
 
@@ -22,6 +22,13 @@ else:
     import tomli as tomllib
 
 
+# 从 src/main/config/config_loader.py 到项目根目录需要 4 级 parent，模块加载时解析一次
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# load_target_products 解析结果缓存: 绝对路径 -> ((st_mtime_ns, st_size), 解析结果)
+_TARGET_PRODUCTS_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
 class ConfigLoader:
     """
     配置加载器
@@ -151,8 +158,7 @@ class ConfigLoader:
             包含 CTP 配置的 .env 文件
         """
         # 显式定位项目根目录下的 .env
-        # 从 src/main/config/config_loader.py 到项目根目录需要 4 级 parent
-        env_path = Path(__file__).resolve().parent.parent.parent.parent / ".env"
+        env_path = _PROJECT_ROOT / ".env"
         if env_path.exists():
             load_dotenv(dotenv_path=env_path)
         else:
@@ -409,23 +415,33 @@ class ConfigLoader:
             品种代码列表 (e.g. ['rb', 'm'])
         """
         if not os.path.isabs(path):
-            # 从 src/main/config/config_loader.py 到项目根目录需要 4 级 parent
-            project_root = Path(__file__).resolve().parent.parent.parent.parent
-            path = str(project_root / path)
+            path = str(_PROJECT_ROOT / path)
             
-        if not os.path.exists(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
             return []
+
+        # 文件未变更 (mtime + size 一致) 时直接复用上次解析结果；
+        # 无论 targets 是否为列表均返回副本，调用方修改不污染缓存
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _TARGET_PRODUCTS_CACHE.get(path)
+        if cached is not None and cached[0] == file_key:
+            return copy.deepcopy(cached[1])
         
         # 尝试 TOML 格式
         if path.endswith('.toml'):
             with open(path, "rb") as f:
                 data = tomllib.load(f)
-                return data.get("targets", [])
-        
-        # 向后兼容：尝试 YAML 格式
-        import yaml
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+                targets = data.get("targets", [])
+        else:
+            # 向后兼容：尝试 YAML 格式
+            import yaml
+            with open(path, "r", encoding="utf-8") as f:
+                targets = yaml.safe_load(f)
+
+        _TARGET_PRODUCTS_CACHE[path] = (file_key, targets)
+        return copy.deepcopy(targets)
 
     @staticmethod
     def load_hedging_config(config: dict) -> dict:
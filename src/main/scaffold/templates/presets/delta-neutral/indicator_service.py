@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 
 
 class DeltaNeutralIndicatorService(IIndicatorService):
+    # 已实现波动率按 instrument.bars 整列计算，预热可整段灌入后只算一次
+    supports_bulk_warmup = True
+
     def __init__(self, rv_window: int = 20, **kwargs):
         self.rv_window = int(rv_window)
         self.config = dict(kwargs)
@@ -10,9 +10,14 @@ if TYPE_CHECKING:
 
 
 class EmaCrossIndicatorService(IIndicatorService):
+    # K 线不连续时整列重算种子，预热可整段灌入后只算一次
+    supports_bulk_warmup = True
+
     def __init__(self, fast_period: int = 8, slow_period: int = 21, **kwargs):
         self.fast_period = int(fast_period)
         self.slow_period = int(slow_period)
+        self.fast_alpha = 2.0 / (self.fast_period + 1)
+        self.slow_alpha = 2.0 / (self.slow_period + 1)
         self.config = dict(kwargs)
 
     def calculate_bar(
@@ -25,19 +30,32 @@ class EmaCrossIndicatorService(IIndicatorService):
         if len(bars) < self.slow_period:
             return IndicatorComputationResult.noop(summary="EMA 样本不足")
 
-        close = bars["close"].astype(float)
-        fast_series = close.ewm(span=self.fast_period, adjust=False).mean()
-        slow_series = close.ewm(span=self.slow_period, adjust=False).mean()
-        prev_fast = float(fast_series.iloc[-2])
-        prev_slow = float(slow_series.iloc[-2])
-        fast = float(fast_series.iloc[-1])
-        slow = float(slow_series.iloc[-1])
+        bar_count = len(bars)
+        last = instrument.indicators.get("ema_cross") or {}
+        if last.get("bar_count") == bar_count - 1:
+            # 逐 bar 推进: EMA_t = EMA_{t-1} + α·(x_t - EMA_{t-1})，O(1) 更新
+            # 收盘价直接取本次 bar 字典，避免 DataFrame 列索引开销
+            close_price = float(bar["close"])
+            prev_fast = last["fast"]
+            prev_slow = last["slow"]
+            fast = prev_fast + self.fast_alpha * (close_price - prev_fast)
+            slow = prev_slow + self.slow_alpha * (close_price - prev_slow)
+        else:
+            # 首次计算或 K 线不连续 (预热批量灌入、快照恢复) 时整列重算作为种子
+            close = bars["close"].astype(float)
+            fast_series = close.ewm(span=self.fast_period, adjust=False).mean()
+            slow_series = close.ewm(span=self.slow_period, adjust=False).mean()
+            prev_fast = float(fast_series.iloc[-2])
+            prev_slow = float(slow_series.iloc[-2])
+            fast = float(fast_series.iloc[-1])
+            slow = float(slow_series.iloc[-1])
 
         payload = {
             "fast": fast,
             "slow": slow,
             "prev_fast": prev_fast,
             "prev_slow": prev_slow,
+            "bar_count": bar_count,
         }
         instrument.indicators["ema_cross"] = payload
         return IndicatorComputationResult(
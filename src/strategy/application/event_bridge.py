@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 from vnpy.event.engine import Event
 from vnpy.trader.object import OrderData, PositionData, TradeData
@@ -21,26 +21,58 @@ if TYPE_CHECKING:
     from src.strategy.strategy_entry import StrategyEntry
 
 
+def _enum_value(value: Any) -> Any:
+    """VnPy 枚举取 .value，其余类型退回 str()。"""
+    try:
+        return value.value
+    except AttributeError:
+        return str(value)
+
+
+def _manual_alert(alert_type: str) -> Callable[[Any], Tuple[str, str]]:
+    def build(event: Any) -> Tuple[str, str]:
+        return alert_type, f"{event.event_name}: {event.vt_symbol} x{event.volume}"
+    return build
+
+
+def _risk_limit_alert(event: RiskLimitExceededEvent) -> Tuple[str, str]:
+    return (
+        "risk_limit",
+        f"风控限额超标: {event.limit_type} {event.current_volume}/{event.limit_volume}",
+    )
+
+
+# 需转发为策略告警的领域事件: 事件类型 -> (alert_type, message) 构造函数，按 type() 精确查表
+_ALERT_BUILDERS: Dict[type, Callable[[Any], Tuple[str, str]]] = {
+    ManualCloseDetectedEvent: _manual_alert("manual_close"),
+    ManualOpenDetectedEvent: _manual_alert("manual_open"),
+    RiskLimitExceededEvent: _risk_limit_alert,
+}
+
+
 class EventBridge:
     """将聚合根事件桥接到外部 VnPy 事件引擎。"""
 
     def __init__(self, entry: "StrategyEntry") -> None:
         self.entry = entry
+        # 回报载荷字典复用: 聚合根同步消费且不保留引用，逐字段覆盖写入即可
+        self._order_buf: Dict[str, Any] = {}
+        self._trade_buf: Dict[str, Any] = {}
+        self._position_buf: Dict[str, Any] = {}
 
     def on_order(self, order: OrderData) -> None:
         """处理订单推送并更新持仓聚合根。"""
         if not self.entry.position_aggregate:
             return
-        order_data = {
-            "vt_orderid": order.vt_orderid,
-            "vt_symbol": order.vt_symbol,
-            "direction": order.direction.value if hasattr(order.direction, "value") else str(order.direction),
-            "offset": order.offset.value if hasattr(order.offset, "value") else str(order.offset),
-            "price": order.price,
-            "volume": order.volume,
-            "traded": order.traded,
-            "status": order.status.value if hasattr(order.status, "value") else str(order.status),
-        }
+        order_data = self._order_buf
+        order_data["vt_orderid"] = order.vt_orderid
+        order_data["vt_symbol"] = order.vt_symbol
+        order_data["direction"] = _enum_value(order.direction)
+        order_data["offset"] = _enum_value(order.offset)
+        order_data["price"] = order.price
+        order_data["volume"] = order.volume
+        order_data["traded"] = order.traded
+        order_data["status"] = _enum_value(order.status)
         self.entry.position_aggregate.update_from_order(order_data)
         self._sync_combination_execution_state()
         self.entry._publish_domain_events()
@@ -50,41 +82,42 @@ class EventBridge:
         """处理成交推送并更新持仓聚合根。"""
         if not self.entry.position_aggregate:
             return
-        trade_data = {
-            "vt_tradeid": trade.vt_tradeid,
-            "vt_orderid": trade.vt_orderid,
-            "vt_symbol": trade.vt_symbol,
-            "direction": trade.direction.value if hasattr(trade.direction, "value") else str(trade.direction),
-            "offset": trade.offset.value if hasattr(trade.offset, "value") else str(trade.offset),
-            "price": trade.price,
-            "volume": trade.volume,
-            "datetime": trade.datetime,
-        }
+        trade_data = self._trade_buf
+        trade_data["vt_tradeid"] = trade.vt_tradeid
+        trade_data["vt_orderid"] = trade.vt_orderid
+        trade_data["vt_symbol"] = trade.vt_symbol
+        trade_data["direction"] = _enum_value(trade.direction)
+        trade_data["offset"] = _enum_value(trade.offset)
+        trade_data["price"] = trade.price
+        trade_data["volume"] = trade.volume
+        trade_data["datetime"] = trade.datetime
         self.entry.position_aggregate.update_from_trade(trade_data)
         self._sync_combination_execution_state()
         self.entry._publish_domain_events()
         self.entry._reconcile_subscriptions("on_trade")
-
-    def process_position_event(self, event: Event) -> None:
-        """处理封装后的持仓事件。"""
-        self.on_position(event.data)
+        # 托管合约成交即持仓变化，绕过快照节流立即推送监控
+        if self.entry.position_aggregate.is_managed(trade.vt_symbol):
+            self.entry._record_snapshot(force=True)
 
     def on_position(self, position: PositionData) -> None:
         """处理持仓推送并触发手动操作检测。"""
         if not self.entry.position_aggregate:
             return
-        position_data = {
-            "vt_symbol": position.vt_symbol,
-            "direction": position.direction.value if hasattr(position.direction, "value") else str(position.direction),
-            "volume": position.volume,
-            "frozen": position.frozen,
-            "price": position.price,
-            "pnl": position.pnl,
-        }
+        position_data = self._position_buf
+        position_data["vt_symbol"] = position.vt_symbol
+        position_data["direction"] = _enum_value(position.direction)
+        position_data["volume"] = position.volume
+        position_data["frozen"] = position.frozen
+        position_data["price"] = position.price
+        position_data["pnl"] = position.pnl
         self.entry.position_aggregate.update_from_position(position_data)
+        # 持仓推送周期性到达，仅当聚合根检测到持仓变化 (产生领域事件) 时强制快照
+        position_changed = self.entry.position_aggregate.has_pending_events()
         self._sync_combination_execution_state()
         self.entry._publish_domain_events()
         self.entry._reconcile_subscriptions("on_position")
+        if position_changed:
+            self.entry._record_snapshot(force=True)
 
     def _sync_combination_execution_state(self) -> None:
         if not self.entry.position_aggregate or not self.entry.combination_aggregate:
@@ -119,23 +152,14 @@ class EventBridge:
 
             # 发布到事件引擎（飞书等订阅者会收到）
             if event_engine:
-                if isinstance(domain_event, (ManualCloseDetectedEvent, ManualOpenDetectedEvent)):
-                    alert_type = "manual_close" if isinstance(domain_event, ManualCloseDetectedEvent) else "manual_open"
+                build_alert = _ALERT_BUILDERS.get(type(domain_event))
+                if build_alert is not None:
+                    alert_type, message = build_alert(domain_event)
                     alert_data = StrategyAlertData.from_domain_event(
                         event=domain_event,
                         strategy_name=self.entry.strategy_name,
                         alert_type=alert_type,
-                        message=f"{domain_event.event_name}: {domain_event.vt_symbol} x{domain_event.volume}"
-                    )
-                    vnpy_event = Event(type=EVENT_STRATEGY_ALERT, data=alert_data)
-                    event_engine.put(vnpy_event)
-
-                elif isinstance(domain_event, RiskLimitExceededEvent):
-                    alert_data = StrategyAlertData.from_domain_event(
-                        event=domain_event,
-                        strategy_name=self.entry.strategy_name,
-                        alert_type="risk_limit",
-                        message=f"风控限额超标: {domain_event.limit_type} {domain_event.current_volume}/{domain_event.limit_volume}"
+                        message=message,
                     )
                     vnpy_event = Event(type=EVENT_STRATEGY_ALERT, data=alert_data)
                     event_engine.put(vnpy_event)
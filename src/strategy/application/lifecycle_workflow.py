@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
 import os
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import Iterator, TYPE_CHECKING
 
 from vnpy.trader.constant import Interval
 from vnpy_portfoliostrategy import StrategyTemplate
@@ -20,17 +22,27 @@ from ..infrastructure.gateway.vnpy_account_gateway import VnpyAccountGateway
 from ..infrastructure.gateway.vnpy_market_data_gateway import VnpyMarketDataGateway
 from ..infrastructure.gateway.vnpy_order_gateway import VnpyOrderGateway
 from ..infrastructure.gateway.vnpy_trade_execution_gateway import VnpyTradeExecutionGateway
+from ..infrastructure.parsing.contract_helper import ContractHelper
 from ..infrastructure.persistence.auto_save_service import AutoSaveService
 from ..infrastructure.persistence.exceptions import CorruptionError
 from ..infrastructure.persistence.json_serializer import JsonSerializer
 from ..infrastructure.persistence.state_repository import ArchiveNotFound, StateRepository
-from ..infrastructure.reporting.feishu_handler import FeishuEventHandler
 from ..runtime import StrategyRuntimeBuilder
 from src.main.bootstrap.database_factory import DatabaseFactory
 
 if TYPE_CHECKING:
     from src.strategy.strategy_entry import StrategyEntry
 
+# src/strategy/application/lifecycle_workflow.py -> 项目根目录，模块加载时解析一次
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# bar_interval 配置 -> VnPy Interval，只读映射
+_INTERVAL_MAP = MappingProxyType({
+    "MINUTE": Interval.MINUTE,
+    "HOUR": Interval.HOUR,
+    "DAILY": Interval.DAILY,
+})
+
 
 def build_runtime(entry: "StrategyEntry", full_config: dict[str, object]):
     return StrategyRuntimeBuilder().build(entry, full_config)
@@ -57,7 +69,7 @@ class LifecycleWorkflow:
 
         # ______________________________  2. 创建领域服务  ______________________________
 
-        project_root = Path(__file__).resolve().parents[3]
+        project_root = _PROJECT_ROOT
 
         full_config = dict(self.entry.setting.get("strategy_full_config") or {})
         if not full_config:
@@ -273,12 +285,7 @@ class LifecycleWorkflow:
         bar_window = int(self.entry.setting.get("bar_window", 0))
         if bar_window > 0:
             bar_interval_str = self.entry.setting.get("bar_interval", "MINUTE")
-            interval_map = {
-                "MINUTE": Interval.MINUTE,
-                "HOUR": Interval.HOUR,
-                "DAILY": Interval.DAILY,
-            }
-            interval = interval_map.get(bar_interval_str, Interval.MINUTE)
+            interval = _INTERVAL_MAP.get(bar_interval_str, Interval.MINUTE)
             self.entry.bar_pipeline = BarPipeline(
                 bar_callback=self.entry._process_bars,
                 window=bar_window,
@@ -290,20 +297,14 @@ class LifecycleWorkflow:
 
         # ______________________________  6. 预热  ______________________________
 
-        original_trading = getattr(self.entry, "trading", True)
-
         if self.entry.backtesting:
             self.entry.logger.info("当前处于回测模式，跳过状态恢复，直接加载历史数据进行初始化")
-            self.entry.warming_up = True
-            setattr(self.entry, "trading", False)
-            try:
-                self.entry.load_bars(self.entry.warmup_days)
-            except Exception:
-                self.entry.logger.error("回测 warmup 失败", exc_info=True)
-                raise
-            finally:
-                setattr(self.entry, "trading", original_trading)
-                self.entry.warming_up = False
+            with self._warmup_mode():
+                try:
+                    self.entry.load_bars(self.entry.warmup_days)
+                except Exception:
+                    self.entry.logger.error("回测 warmup 失败", exc_info=True)
+                    raise
         else:
             # 实盘预热: 加载状态 + 标的补漏 + Postgres 回放
             try:
@@ -344,35 +345,51 @@ class LifecycleWorkflow:
 
             active_contracts = list(self.entry.target_aggregate.get_all_active_contracts() or [])
             if isinstance(getattr(self.entry, "vt_symbols", None), list):
+                # 集合判重，避免逐个 list 成员检查的 O(N²)；保持原有顺序追加
+                known_symbols = set(self.entry.vt_symbols)
                 for vt_symbol in active_contracts:
-                    if vt_symbol and vt_symbol not in self.entry.vt_symbols:
+                    if vt_symbol and vt_symbol not in known_symbols:
+                        known_symbols.add(vt_symbol)
                         self.entry.vt_symbols.append(vt_symbol)
 
-            self.entry.warming_up = True
-            setattr(self.entry, "trading", False)
-            try:
-                vt_symbols = list(self.entry.target_aggregate.get_all_active_contracts() or [])
-                if not vt_symbols and isinstance(getattr(self.entry, "vt_symbols", None), list):
-                    vt_symbols = list(self.entry.vt_symbols)
-
-                ok = self.entry.history_repo.replay_bars_from_database(
-                    vt_symbols=vt_symbols,
-                    days=self.entry.warmup_days,
-                    on_bars_callback=self.entry.on_bars,  # on_bars 内部根据 bar_pipeline 分支
-                )
-                if not ok:
-                    self.entry.logger.error("实盘 warmup 失败: Postgres 中未能回放到有效 K 线")
-                    raise RuntimeError("实盘 warmup 失败")
-            except Exception:
-                self.entry.logger.error("实盘 warmup 执行失败（可能是 BarPipeline 处理异常）", exc_info=True)
-                raise
-            finally:
-                setattr(self.entry, "trading", original_trading)
-                self.entry.warming_up = False
+            with self._warmup_mode():
+                try:
+                    vt_symbols = active_contracts
+                    if not vt_symbols and isinstance(getattr(self.entry, "vt_symbols", None), list):
+                        vt_symbols = list(self.entry.vt_symbols)
+
+                    # K 线合成需逐 bar 推进窗口；指标服务未声明 supports_bulk_warmup 时
+                    # 其状态可能依赖调用次数 (如逐 bar 追加的历史序列)，同样保留逐时间戳回放
+                    bulk_warmup = not self.entry.bar_pipeline and bool(
+                        getattr(self.entry.indicator_service, "supports_bulk_warmup", False)
+                    )
+                    if not bulk_warmup:
+                        ok = self.entry.history_repo.replay_bars_from_database(
+                            vt_symbols=vt_symbols,
+                            days=self.entry.warmup_days,
+                            on_bars_callback=self.entry.on_bars,
+                        )
+                    else:
+                        # 直通模式且指标可整列重算: 按合约整段灌入，指标只算一次
+                        frames = self.entry.history_repo.load_bars_as_frames(
+                            vt_symbols=vt_symbols,
+                            days=self.entry.warmup_days,
+                        )
+                        self.entry.market_workflow.handle_bars_bulk(frames)
+                        ok = bool(frames)
+                    if not ok:
+                        self.entry.logger.error("实盘 warmup 失败: Postgres 中未能回放到有效 K 线")
+                        raise RuntimeError("实盘 warmup 失败")
+                except Exception:
+                    self.entry.logger.error("实盘 warmup 执行失败（可能是 BarPipeline 处理异常）", exc_info=True)
+                    raise
 
         # ______________________________  7. 注册飞书告警  ______________________________
 
         if self.entry.feishu_webhook:
+            # 飞书处理器依赖 requests/urllib3，仅在配置 webhook 时按需导入
+            from ..infrastructure.reporting.feishu_handler import FeishuEventHandler
+
             self.entry.feishu_handler = FeishuEventHandler(
                 webhook_url=self.entry.feishu_webhook,
                 strategy_name=self.entry.strategy_name
@@ -386,6 +403,18 @@ class LifecycleWorkflow:
 
         self.entry.logger.info("策略初始化完成")
 
+    @contextmanager
+    def _warmup_mode(self) -> Iterator[None]:
+        """预热期间关闭交易开关并标记 warming_up，退出时恢复原交易状态。"""
+        original_trading = getattr(self.entry, "trading", True)
+        self.entry.warming_up = True
+        self.entry.trading = False
+        try:
+            yield
+        finally:
+            self.entry.trading = original_trading
+            self.entry.warming_up = False
+
     def _sync_live_oms_snapshot(self) -> None:
         """在启用交易前将券商侧 OMS 状态灌回聚合根。"""
         positions = list(self.entry.account_gateway.get_all_positions() or [])
@@ -417,6 +446,7 @@ class LifecycleWorkflow:
         except Exception:
             pass
         self.entry.logger.info("策略启动")
+        ContractHelper.refresh_current_year()
         self.entry._validate_universe()
         self.entry._reconcile_subscriptions("on_init")
 
@@ -428,6 +458,9 @@ class LifecycleWorkflow:
             pass
         self.entry.logger.info("策略停止")
 
+        # 监控快照按间隔节流，停止前强制刷新一次最终状态
+        self.entry._record_snapshot(force=True)
+
         # 保存状态并关闭线程池 - 仅在非回测模式下
         if self.entry.auto_save_service:
             self.entry.auto_save_service.force_save(self.entry._create_snapshot)
@@ -443,3 +476,4 @@ class LifecycleWorkflow:
                     )
                 except Exception:
                     pass
+            self.entry.feishu_handler.shutdown()
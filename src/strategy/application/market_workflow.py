@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 import time
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from vnpy.trader.object import BarData, TickData
 
@@ -24,9 +24,16 @@ from ..domain.value_object.signal.strategy_contract import (
 from ..infrastructure.parsing.contract_helper import ContractHelper
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from src.strategy.strategy_entry import StrategyEntry
 
 
+UNIVERSE_CHECK_INTERVAL = timedelta(hours=1)
+# 每日换月检查时刻 14:50，以当日分钟序号表示，单次整数比较即可判定
+ROLLOVER_CHECK_MINUTE_OF_DAY = 14 * 60 + 50
+
+
 class MarketWorkflow:
     """协调行情回调与 K 线处理流程。"""
 
@@ -49,9 +56,12 @@ class MarketWorkflow:
         return getattr(portfolio, role_name, None)
 
     def on_tick(self, tick: TickData) -> None:
-        """处理逐笔行情推送，启用管道时转发给 K 线管道。"""
-        if self.entry.bar_pipeline:
-            self.entry.bar_pipeline.handle_tick(tick)
+        """处理逐笔行情推送，启用管道时转发给 K 线管道；预热回放期间直接丢弃。"""
+        if self.entry.warming_up:
+            return
+        bar_pipeline = self.entry.bar_pipeline
+        if bar_pipeline:
+            bar_pipeline.handle_tick(tick)
 
     def on_bars(self, bars: Dict[str, BarData]) -> None:
         """处理 K 线回调，包含换月检查与主流程分发。"""
@@ -65,51 +75,50 @@ class MarketWorkflow:
             universe = getattr(runtime, "universe", None)
             rollover_checker = getattr(universe, "rollover_checker", None)
 
+            # 每个交易日 14:50 只检查一次，按日期去重，无需逐 bar 复位标志
             if (
-                current_dt.hour == 14
-                and current_dt.minute == 50
+                current_dt.hour * 60 + current_dt.minute == ROLLOVER_CHECK_MINUTE_OF_DAY
                 and rollover_checker is not None
+                and self.entry.last_rollover_check_date != current_dt.date()
             ):
-                if not self.entry.rollover_check_done:
-                    self.entry.logger.info(f"触发每日换月检查: {current_dt}")
-                    if self.entry.target_aggregate and self.entry.market_gateway:
-                        for product in self.entry.target_products:
-                            try:
-                                current_vt = self.entry.target_aggregate.get_active_contract(product)
-                                if not current_vt:
-                                    continue
-
-                                all_contracts = self.entry.market_gateway.get_all_contracts()
-                                product_contracts = [
-                                    c for c in all_contracts
-                                    if ContractHelper.is_contract_of_product(c, product)
-                                ]
-                                if not product_contracts:
-                                    continue
-
-                                market_data = self.build_future_market_data(product_contracts)
-                                dominant = self.entry.future_selection_service.select_dominant_contract(
-                                    product_contracts,
-                                    current_dt.date(),
-                                    market_data=market_data,
-                                    log_func=self.entry.logger.info,
-                                )
-                                if dominant and dominant.vt_symbol != current_vt:
-                                    new_vt = dominant.vt_symbol
-                                    self.entry.logger.info(f"品种 {product} 换月: {current_vt} -> {new_vt}")
-                                    self.entry.target_aggregate.set_active_contract(product, new_vt)
-                                    self.entry.target_aggregate.get_or_create_instrument(new_vt)
-                                    self.entry._subscribe_symbol(new_vt)
-                                    rollover_changed = True
-                            except Exception as e:
-                                self.entry.logger.error(f"品种 {product} 换月检查失败: {e}")
-                    self.entry.rollover_check_done = True
-            else:
-                self.entry.rollover_check_done = False
-
-            self.entry.universe_check_interval += 1
-            if self.entry.universe_check_interval >= self.entry.universe_check_threshold:
-                self.entry.universe_check_interval = 0
+                self.entry.last_rollover_check_date = current_dt.date()
+                self.entry.logger.info(f"触发每日换月检查: {current_dt}")
+                ContractHelper.refresh_current_year()
+                if self.entry.target_aggregate and self.entry.market_gateway:
+                    contracts_by_product = self._get_contracts_by_product()
+                    for product in self.entry.target_products:
+                        try:
+                            current_vt = self.entry.target_aggregate.get_active_contract(product)
+                            if not current_vt:
+                                continue
+
+                            product_contracts = list(contracts_by_product.get(product.lower(), ()))
+                            if not product_contracts:
+                                continue
+
+                            market_data = self.build_future_market_data(product_contracts)
+                            dominant = self.entry.future_selection_service.select_dominant_contract(
+                                product_contracts,
+                                current_dt.date(),
+                                market_data=market_data,
+                                log_func=self.entry.logger.info,
+                            )
+                            if dominant and dominant.vt_symbol != current_vt:
+                                new_vt = dominant.vt_symbol
+                                self.entry.logger.info(f"品种 {product} 换月: {current_vt} -> {new_vt}")
+                                self.entry.target_aggregate.set_active_contract(product, new_vt)
+                                self.entry.target_aggregate.get_or_create_instrument(new_vt)
+                                self.entry._subscribe_symbol(new_vt)
+                                rollover_changed = True
+                        except Exception as e:
+                            self.entry.logger.error(f"品种 {product} 换月检查失败: {e}")
+
+            # 按行情时间每小时巡检一次，与 K 线回调频率解耦
+            last_check = self.entry.last_universe_check_dt
+            if last_check is None:
+                self.entry.last_universe_check_dt = current_dt
+            elif current_dt - last_check >= UNIVERSE_CHECK_INTERVAL:
+                self.entry.last_universe_check_dt = current_dt
                 self.entry._validate_universe()
 
             if rollover_changed:
@@ -131,10 +140,24 @@ class MarketWorkflow:
 
     def process_bars(self, bars: Dict[str, BarData]) -> None:
         """将行情处理为一条可扩展的决策流水线骨架。"""
-        if not self.entry.target_aggregate:
+        entry = self.entry
+        if not entry.target_aggregate:
             return
 
+        # 循环内不变的方法引用提前绑定，省去逐合约的多级属性查找
+        update_bar = entry.target_aggregate.update_bar
+        position_aggregate = entry.position_aggregate
+        # 持仓按标的一次分组，未持仓的标的直接跳过平仓流水线，无需逐标的全量扫描
+        positions_by_underlying = (
+            position_aggregate.get_open_positions_by_underlying() if position_aggregate else {}
+        )
+        build_option_chain = self._build_option_chain_snapshot
+        build_indicator_context = self._build_indicator_context
+        run_indicator_stage = self._run_indicator_stage
+        publish_trace = self._publish_trace
+
         for vt_symbol, bar in bars.items():
+            # 领域层只认字典形式的 K 线，不直接依赖 VnPy BarData
             bar_data = {
                 "datetime": bar.datetime,
                 "open": bar.open_price,
@@ -143,13 +166,13 @@ class MarketWorkflow:
                 "close": bar.close_price,
                 "volume": bar.volume,
             }
-            self.entry.current_dt = bar.datetime
+            entry.current_dt = bar.datetime
 
             try:
-                instrument = self.entry.target_aggregate.update_bar(vt_symbol, bar_data)
-                option_chain = self._build_option_chain_snapshot(vt_symbol, instrument, bar_data)
-                indicator_context = self._build_indicator_context(vt_symbol, instrument, bar_data, option_chain)
-                indicator_result = self._run_indicator_stage(instrument, bar_data, indicator_context)
+                instrument = update_bar(vt_symbol, bar_data)
+                option_chain = build_option_chain(vt_symbol, instrument, bar_data)
+                indicator_context = build_indicator_context(vt_symbol, instrument, bar_data, option_chain)
+                indicator_result = run_indicator_stage(instrument, bar_data, indicator_context)
 
                 open_trace = self._run_open_pipeline(
                     vt_symbol=vt_symbol,
@@ -158,13 +181,9 @@ class MarketWorkflow:
                     indicator_result=indicator_result,
                     option_chain=option_chain,
                 )
-                self._publish_trace(open_trace)
+                publish_trace(open_trace)
 
-                if self.entry.position_aggregate:
-                    positions = self.entry.position_aggregate.get_positions_by_underlying(vt_symbol)
-                else:
-                    positions = []
-                for position in positions:
+                for position in positions_by_underlying.get(vt_symbol, ()):
                     close_trace = self._run_close_pipeline(
                         vt_symbol=vt_symbol,
                         instrument=instrument,
@@ -173,12 +192,39 @@ class MarketWorkflow:
                         indicator_result=indicator_result,
                         option_chain=option_chain,
                     )
-                    self._publish_trace(close_trace)
+                    publish_trace(close_trace)
 
             except Exception as e:
-                self.entry.logger.error(f"处理 K 线更新失败 [{vt_symbol}]: {e}")
+                entry.logger.error(f"处理 K 线更新失败 [{vt_symbol}]: {e}")
+
+        # 预热回放只需推进指标，监控快照仅反映实盘运行状态
+        if not entry.warming_up:
+            entry._record_snapshot()
 
-        self.entry._record_snapshot()
+    def handle_bars_bulk(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """
+        预热批量灌入: 每个合约一次性追加整段历史 K 线，指标只在最后一根 K 线上计算一次。
+
+        仅适用于声明 supports_bulk_warmup 的指标服务 (指标可由 instrument.bars 整列重算，
+        单次调用即与逐 bar 回放结果一致)，其余服务由调用方退回逐 bar 回放；
+        预热期间不交易，开平仓流水线跳过，也不记录监控快照。
+        """
+        if not self.entry.target_aggregate:
+            return
+
+        for vt_symbol, frame in frames.items():
+            if frame.empty:
+                continue
+
+            try:
+                instrument = self.entry.target_aggregate.update_bars(vt_symbol, frame)
+                bar_data = frame.iloc[-1].to_dict()
+                self.entry.current_dt = bar_data["datetime"]
+                option_chain = self._build_option_chain_snapshot(vt_symbol, instrument, bar_data)
+                indicator_context = self._build_indicator_context(vt_symbol, instrument, bar_data, option_chain)
+                self._run_indicator_stage(instrument, bar_data, indicator_context)
+            except Exception as e:
+                self.entry.logger.error(f"批量灌入 K 线失败 [{vt_symbol}]: {e}")
 
     def _run_indicator_stage(
         self,
@@ -684,17 +730,17 @@ class MarketWorkflow:
         ):
             return
 
-        for product in self.entry.target_products:
-            existing = self.entry.target_aggregate.get_active_contract(product)
-            if existing:
-                continue
+        missing_products = [
+            product for product in self.entry.target_products
+            if not self.entry.target_aggregate.get_active_contract(product)
+        ]
+        if not missing_products:
+            return
 
+        contracts_by_product = self._get_contracts_by_product()
+        for product in missing_products:
             try:
-                all_contracts = self.entry.market_gateway.get_all_contracts()
-                product_contracts = [
-                    c for c in all_contracts
-                    if ContractHelper.is_contract_of_product(c, product)
-                ]
+                product_contracts = list(contracts_by_product.get(product.lower(), ()))
                 if not product_contracts:
                     self.entry.logger.warning(f"品种 {product} 未找到可用合约")
                     continue
@@ -712,6 +758,15 @@ class MarketWorkflow:
             except Exception as e:
                 self.entry.logger.error(f"品种 {product} 主力合约初始化失败: {e}")
 
+    def _get_contracts_by_product(self) -> Mapping[str, Tuple[Any, ...]]:
+        """全量合约只取一次并按品种分桶，避免逐品种重复扫描。"""
+        try:
+            all_contracts = self.entry.market_gateway.get_all_contracts() or []
+        except Exception as e:
+            self.entry.logger.error(f"获取全量合约失败: {e}")
+            return {}
+        return ContractHelper.build_product_index(all_contracts)
+
     def build_future_market_data(self, contracts: List[Any]) -> Dict[str, SelectionMarketData]:
         """基于行情网关逐笔数据构建主力选择所需行情映射。"""
         if not self.entry.market_gateway:
@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.strategy.strategy_entry import StrategyEntry
 
 
+# Minimum wall-clock gap between two monitor snapshots unless forced.
+DEFAULT_SNAPSHOT_INTERVAL_SEC = 30.0
+
+
 class StateWorkflow:
     """Builds strategy snapshots and dispatches optional snapshot sinks."""
 
     def __init__(self, entry: "StrategyEntry") -> None:
         self.entry = entry
+        # -inf so the first snapshot is never throttled, whatever the monotonic origin.
+        self._last_snapshot_ts = float("-inf")
 
     def create_snapshot(self) -> Dict[str, Any]:
         snapshot = {
             "target_aggregate": self.entry.target_aggregate.to_snapshot(),
             "position_aggregate": self.entry.position_aggregate.to_snapshot(),
-            "current_dt": self.entry.current_dt,
         }
+        # current_dt is unset until the first bar arrives; omit rather than persist None.
+        if self.entry.current_dt is not None:
+            snapshot["current_dt"] = self.entry.current_dt
         if self.entry.combination_aggregate:
             snapshot["combination_aggregate"] = self.entry.combination_aggregate.to_snapshot()
 
@@ -41,13 +50,21 @@ class StateWorkflow:
 
         return snapshot
 
-    def record_snapshot(self) -> None:
+    def record_snapshot(self, force: bool = False) -> None:
         runtime = getattr(self.entry, "runtime", None)
         state_roles = getattr(runtime, "state", None)
         snapshot_sinks = tuple(getattr(state_roles, "snapshot_sinks", ()) or ())
         if not snapshot_sinks or not self.entry.target_aggregate:
             return
 
+        # Monitor snapshots serialize every instrument; throttle per-bar calls.
+        now = time.monotonic()
+        if not force:
+            interval = getattr(self.entry, "snapshot_interval_sec", DEFAULT_SNAPSHOT_INTERVAL_SEC)
+            if now - self._last_snapshot_ts < interval:
+                return
+        self._last_snapshot_ts = now
+
         for sink in snapshot_sinks:
             try:
                 sink(
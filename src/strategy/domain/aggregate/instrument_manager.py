@@ -104,6 +104,23 @@ class InstrumentManager:
         instrument = self.get_or_create_instrument(vt_symbol)
         instrument.append_bar(bar_data)
         return instrument
+
+    def update_bars(self, vt_symbol: str, frame: pd.DataFrame) -> TargetInstrument:
+        """
+        批量更新 K 线数据
+        
+        由应用层预热流程调用，一次性追加整段历史 K 线。
+        
+        Args:
+            vt_symbol: 合约代码
+            frame: K 线 DataFrame (包含 datetime, open, high, low, close, volume)
+            
+        Returns:
+            更新后的 TargetInstrument 实体
+        """
+        instrument = self.get_or_create_instrument(vt_symbol)
+        instrument.append_bars(frame)
+        return instrument
     
     def get_bar_history(
         self,
@@ -25,6 +25,15 @@ from ..value_object.trading.execution_state import (
     PositionExecutionState,
 )
 
+_ORDER_STATUS_MAPPING = {
+    "submitting": OrderStatus.SUBMITTING,
+    "nottraded": OrderStatus.NOTTRADED,
+    "parttraded": OrderStatus.PARTTRADED,
+    "alltraded": OrderStatus.ALLTRADED,
+    "cancelled": OrderStatus.CANCELLED,
+    "rejected": OrderStatus.REJECTED,
+}
+
 
 class PositionAggregate:
     """Owns strategy positions, pending orders, and leg execution state."""
@@ -92,6 +101,14 @@ class PositionAggregate:
             and position.volume > 0
         ]
 
+    def get_open_positions_by_underlying(self) -> Dict[str, List[Position]]:
+        """Group open positions by underlying in a single pass over all positions."""
+        grouped: Dict[str, List[Position]] = {}
+        for position in self._positions.values():
+            if not position.is_closed and position.volume > 0:
+                grouped.setdefault(position.underlying_vt_symbol, []).append(position)
+        return grouped
+
     def get_active_positions(self) -> List[Position]:
         return [position for position in self._positions.values() if position.is_active]
 
@@ -318,15 +335,7 @@ class PositionAggregate:
         if order is None:
             return
 
-        status_mapping = {
-            "submitting": OrderStatus.SUBMITTING,
-            "nottraded": OrderStatus.NOTTRADED,
-            "parttraded": OrderStatus.PARTTRADED,
-            "alltraded": OrderStatus.ALLTRADED,
-            "cancelled": OrderStatus.CANCELLED,
-            "rejected": OrderStatus.REJECTED,
-        }
-        new_status = status_mapping.get(status)
+        new_status = _ORDER_STATUS_MAPPING.get(status)
         if new_status:
             order.update_status(new_status, traded)
 
@@ -1,6 +1,7 @@
 import calendar
 import math
 from datetime import date
+from operator import itemgetter
 from typing import Callable, Dict, List, Optional, Tuple
 
 from vnpy.trader.object import ContractData
@@ -70,7 +71,7 @@ class FutureSelectionService:
             score = volume * volume_weight + open_interest * oi_weight
             scores.append((contract, score))
 
-        selected, selected_score = max(scores, key=lambda x: x[1])
+        selected, selected_score = max(scores, key=itemgetter(1))
         if log_func:
             log_func(
                 f"选择主力合约: {selected.vt_symbol}, "
@@ -128,10 +129,11 @@ class FutureSelectionService:
                 log_func(f"未知的过滤模式: {mode}")
             return []
 
-        # 过滤合约
+        # 过滤合约 (到期日解析按合约代码缓存，重复调用只剩查表)
+        get_expiry = ContractHelper.get_expiry_from_symbol
         result = []
         for contract in contracts:
-            expiry = ContractHelper.get_expiry_from_symbol(contract.symbol)
+            expiry = get_expiry(contract.symbol)
             if expiry is None:
                 if log_func:
                     log_func(f"无法解析合约 {contract.symbol} 的到期日，已排除")
@@ -454,12 +454,12 @@ class OptionSelectorService:
         if "days_to_expiry" not in df.columns:
             return df
         
-        result = df.copy()
-        start_len = len(result)
-        
-        result = result[result["days_to_expiry"] >= self.config.min_trading_days]
-        result = result[result["days_to_expiry"] <= self.config.max_trading_days]
-        
+        start_len = len(df)
+
+        # 上下界合并为一次布尔索引 (索引本身即返回新 DataFrame，无需预先 copy)
+        days = df["days_to_expiry"]
+        result = df[(days >= self.config.min_trading_days) & (days <= self.config.max_trading_days)]
+
         if log_func and len(result) < start_len:
             log_func(f"[DEBUG-OPT] 到期日过滤: {start_len} -> {len(result)} (days={self.config.min_trading_days}-{self.config.max_trading_days})")
         
@@ -731,16 +731,21 @@ class OptionSelectorService:
                 log_func("[DELTA] 筛选失败: 到期日过滤后为空")
             return None
 
-        # 4. 查找候选合约的 Greeks 数据
-        candidates = []
-        for _, row in df.iterrows():
-            vt_symbol = str(row.get("vt_symbol", ""))
-            greeks = greeks_data.get(vt_symbol)
-            if greeks is not None and greeks.success:
-                candidates.append((row, greeks.delta))
+        # 4. 查找候选合约的 Greeks 数据 (整列映射，避免 iterrows 逐行构造 Series)
+        delta_map = {
+            vt_symbol: greeks.delta
+            for vt_symbol, greeks in greeks_data.items()
+            if greeks is not None and greeks.success
+        }
+        df = df.reset_index(drop=True)
+        if "vt_symbol" in df.columns:
+            vt_symbols = df["vt_symbol"].astype(str)
+        else:
+            vt_symbols = pd.Series("", index=df.index)
+        has_greeks = vt_symbols.isin(delta_map.keys())
 
         # 5. 无 Greeks 数据时回退到虚值档位选择
-        if not candidates:
+        if not has_greeks.any():
             if log_func:
                 log_func("[DELTA] 无可用 Greeks 数据，回退到虚值档位选择")
             return self.select_option(
@@ -748,13 +753,11 @@ class OptionSelectorService:
             )
 
         # 6. 按 delta_tolerance 范围过滤
-        filtered = [
-            (row, delta)
-            for row, delta in candidates
-            if abs(delta - target_delta) <= delta_tolerance
-        ]
+        deltas = vt_symbols[has_greeks].map(delta_map).astype(float)
+        diffs = (deltas - target_delta).abs()
+        diffs = diffs[diffs <= delta_tolerance]
 
-        if not filtered:
+        if diffs.empty:
             if log_func:
                 log_func(
                     f"[DELTA] 无候选合约在 Delta 容差范围内 "
@@ -762,10 +765,11 @@ class OptionSelectorService:
                 )
             return None
 
-        # 7. 选择 Delta 最接近目标值的合约
-        best_row, best_delta = min(filtered, key=lambda x: abs(x[1] - target_delta))
+        # 7. 选择 Delta 最接近目标值的合约 (并列时取靠前者)
+        best_index = diffs.idxmin()
+        best_delta = float(deltas[best_index])
 
-        result = self._to_option_contract(best_row, option_type)
+        result = self._to_option_contract(df.loc[best_index], option_type)
         if log_func:
             log_func(
                 f"[DELTA] 选中: {result.vt_symbol} "
@@ -60,6 +60,23 @@ class TargetInstrument:
         else:
             self.bars = pd.concat([self.bars, new_row], ignore_index=True)
         self.last_update_time = bar_data.get("datetime", datetime.now())
+
+    def append_bars(self, frame: pd.DataFrame) -> None:
+        """
+        批量追加 K 线数据（单次 concat，用于预热灌入）
+        
+        Args:
+            frame: 按时间升序、包含 datetime, open, high, low, close, volume 列的 DataFrame
+        """
+        if frame.empty:
+            return
+        if self.bars.empty:
+            existing_cols = list(self.bars.columns)
+            new_cols = [c for c in frame.columns if c not in existing_cols]
+            self.bars = frame.reindex(columns=existing_cols + new_cols).reset_index(drop=True)
+        else:
+            self.bars = pd.concat([self.bars, frame], ignore_index=True)
+        self.last_update_time = frame["datetime"].iloc[-1]
     
     def get_latest_bar(self) -> Optional[pd.Series]:
         """获取最新的 K 线数据"""
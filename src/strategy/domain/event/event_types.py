@@ -242,13 +242,14 @@ class CombinationExecutionFailedEvent(DomainEvent):
 
 
 # ========== 策略告警数据 (用于飞书通知) ==========
-@dataclass
+@dataclass(slots=True)
 class StrategyAlertData:
     """
     策略告警数据
     
     用于通过 VnPy EventEngine 发送告警通知。
     飞书 Handler 订阅此类型的事件并发送消息。
+    使用 slots 省去实例 __dict__。
     """
     strategy_name: str
     alert_type: str           # "manual_open", "manual_close", "order_rejected", etc.
@@ -278,16 +279,14 @@ class StrategyAlertData:
         Returns:
             StrategyAlertData 实例
         """
-        vt_symbol = getattr(event, "vt_symbol", "")
-        volume = getattr(event, "volume", 0)
-        
+        # 按字段顺序位置传参，省去关键字参数匹配
         return cls(
-            strategy_name=strategy_name,
-            alert_type=alert_type,
-            message=message,
-            timestamp=event.timestamp,
-            vt_symbol=vt_symbol,
-            volume=volume,
+            strategy_name,
+            alert_type,
+            message,
+            event.timestamp,
+            getattr(event, "vt_symbol", ""),
+            getattr(event, "volume", 0),
         )
 
 
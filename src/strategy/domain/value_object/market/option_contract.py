@@ -10,9 +10,9 @@ from typing import Literal
 OptionType = Literal["call", "put"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptionContract:
-    """期权合约信息"""
+    """期权合约信息 (不可变值对象，按链逐档构造，slots 省去实例 __dict__)"""
     vt_symbol: str              # 合约代码
     underlying_symbol: str      # 标的代码
     option_type: OptionType     # 期权类型 (call/put)
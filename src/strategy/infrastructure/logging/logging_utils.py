@@ -9,6 +9,9 @@ from src.main.config.logging_config_loader import (
 )
 from src.main.utils.logging_setup import DailyFileHandler, normalize_log_name
 
+# 此文件位于 src/strategy/infrastructure/logging/logging_utils.py，根目录位于 ../../../../
+_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
 
 def _resolve_fallback_level() -> int:
     """解析独立运行时（未配置根日志）策略日志级别。"""
@@ -55,13 +58,7 @@ def setup_strategy_logger(name: str, log_file: str = "strategy.log") -> logging.
             handler.close()
             logger.removeHandler(handler)
         
-    # 确定项目根目录
-    # 此文件位于 src/strategy/infrastructure/logging/logging_utils.py
-    # 根目录位于 ../../../../
-    current_file = Path(__file__).resolve()
-    project_root = current_file.parents[4]
-    
-    log_root = project_root / "logs" / "runner"
+    log_root = _PROJECT_ROOT / "logs" / "runner"
     relative_log_path = normalize_log_name(log_file)
     log_dir = log_root / relative_log_path.parent
     
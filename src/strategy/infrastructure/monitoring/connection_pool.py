@@ -0,0 +1,57 @@
+"""进程级监控数据库连接池。
+
+同一进程内的多个 StrategyMonitor 按 (database, user, password, host, port)
+共享同一个 PooledPostgresqlDatabase，避免每个实例各自建连与重复解析配置。
+get_pool 以配置元组为键 lru_cache 缓存且不淘汰，连接池生命周期即进程生命周期；
+策略停止后连接池仍保留，随进程退出释放。
+
+使用约定:
+- peewee 连接按线程持有，调用方必须在 `with db.connection_context():` 内使用，
+  退出时连接归还连接池；不要裸调 db.connect()，否则连接滞留在调用线程上
+- 连接只在单次写入期间持有，并发持有数即同时写入的线程数；
+  max_connections 为并发上限，连接用尽时最多阻塞等待 POOL_TIMEOUT_SEC 而非立即报错
+
+策略状态 (strategy_state) 不走此连接池: StateRepository 使用 vn.py 数据库配置
+经 DatabaseFactory 取得的连接，与监控库配置相互独立，且只由自动保存单线程与 on_stop 写入。
+"""
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from playhouse.pool import PooledPostgresqlDatabase
+
+POOL_MAX_CONNECTIONS = 8
+POOL_TIMEOUT_SEC = 10
+
+
+@lru_cache(maxsize=None)
+def get_pool(
+    database: str,
+    user: str,
+    password: str,
+    host: str,
+    port: int,
+) -> PooledPostgresqlDatabase:
+    """按连接参数获取（或首次创建）进程级共享连接池。"""
+    return PooledPostgresqlDatabase(
+        database,
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        max_connections=POOL_MAX_CONNECTIONS,
+        stale_timeout=300,
+        timeout=POOL_TIMEOUT_SEC,
+        autorollback=True,
+    )
+
+
+def get_pool_for_config(cfg: Dict[str, Any]) -> PooledPostgresqlDatabase:
+    """从监控数据库配置字典获取共享连接池。"""
+    return get_pool(
+        cfg["database"],
+        cfg["user"],
+        cfg.get("password", "") or "",
+        cfg["host"],
+        int(cfg.get("port", 5432) or 5432),
+    )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict
 
+import orjson
+
 
 MONITOR_SNAPSHOT_UPDATES_CHANNEL = "monitor_snapshot_updates"
 MONITOR_DECISION_TRACE_UPDATES_CHANNEL = "monitor_decision_trace_updates"
@@ -39,14 +40,14 @@ def build_decision_trace_notification(
 
 
 def encode_notification_payload(payload: Dict[str, Any]) -> str:
-    return json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode("utf-8")
 
 
 def decode_notification_payload(payload: str) -> Dict[str, Any]:
     if not payload:
         return {}
     try:
-        obj = json.loads(payload)
+        obj = orjson.loads(payload)
     except Exception:
         return {}
     return obj if isinstance(obj, dict) else {}
@@ -8,6 +8,7 @@ from peewee import PostgresqlDatabase
 from ...domain.aggregate.instrument_manager import InstrumentManager
 from ...domain.aggregate.position_aggregate import PositionAggregate
 from ..persistence.json_serializer import JsonSerializer
+from .connection_pool import get_pool_for_config
 from .model.monitor_signal_event_po import MonitorSignalEventPO
 from .model.monitor_signal_snapshot_po import MonitorSignalSnapshotPO
 from .notification_protocol import (
@@ -48,6 +49,11 @@ class StrategyMonitor:
         if not self._monitor_db_config.get("host"):
             self.monitor_db_enabled = False
 
+        cfg = self._monitor_db_config
+        self._monitor_db_ready = bool(
+            self.monitor_db_enabled and cfg.get("host") and cfg.get("user") and cfg.get("database")
+        )
+
         self._monitor_tables_ensured = False
         self._monitor_db: Optional[PostgresqlDatabase] = None
         self._last_status_map: Dict[str, Dict[str, bool]] = {}
@@ -58,25 +64,15 @@ class StrategyMonitor:
         return self._json_serializer.serialize(payload, inject_schema_version=False)
 
     def _monitor_db_available(self) -> bool:
-        if not self.monitor_db_enabled:
-            return False
-        cfg = self._monitor_db_config
-        return bool(cfg.get("host") and cfg.get("user") and cfg.get("database"))
+        return self._monitor_db_ready
 
     def _monitor_db_connect(self) -> Optional[PostgresqlDatabase]:
-        if not self._monitor_db_available():
+        """返回共享连接池；调用方通过 connection_context() 借出连接。"""
+        if not self._monitor_db_ready:
             return None
         try:
             if self._monitor_db is None:
-                self._monitor_db = PostgresqlDatabase(
-                    self._monitor_db_config["database"],
-                    user=self._monitor_db_config["user"],
-                    password=self._monitor_db_config.get("password", ""),
-                    host=self._monitor_db_config["host"],
-                    port=int(self._monitor_db_config.get("port", 5432)),
-                    autorollback=True,
-                )
-            self._monitor_db.connect(reuse_if_open=True)
+                self._monitor_db = get_pool_for_config(self._monitor_db_config)
             return self._monitor_db
         except Exception:
             return None
@@ -1,8 +1,53 @@
 from datetime import date
-from typing import Any, List, Optional, Callable, Iterator, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Optional, Callable, Iterator, Dict, Mapping, Tuple
 import pandas as pd
 import re
 
+# 合约解析正则在模块加载时预编译，避免逐合约调用时的 re 缓存查找
+_PRODUCT_SUFFIX_RE = re.compile(r"^([a-zA-Z]+)(\d+)")
+_PRODUCT_PREFIX_RE = re.compile(r"^([a-zA-Z]+)")
+# "-C-"/"-P-" 中缀或 "C4000"/"P-4000" 尾缀，单次 search 取回期权方向字母
+_OPT_TYPE_RE = re.compile(r"-(?P<s1>[CP])-|(?P<s2>[CP])-?[0-9]+(?:\.[0-9]+)?$", re.IGNORECASE)
+_STRIKE_TAIL_RE = re.compile(r"([CPcp])[-]?([0-9]+(?:\.[0-9]+)?)$")
+_EXPIRY_DIGITS_RE = re.compile(r"(\d{3,4})$")
+_YYMM_RE = re.compile(r"([a-zA-Z]+)(\d{4})")
+_STRIKE_RANGE_RE = re.compile(r"\d{4}[-]?([CP])[-]?(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# 当前年份缓存: 解析热路径不再逐次调用 date.today()，由每日换月检查 / 策略启动时刷新
+_CURRENT_YEAR = date.today().year
+
+
+@lru_cache(maxsize=4096)
+def _parse_expiry(symbol: str, current_year: int) -> Optional[date]:
+    """按合约代码与当前年份解析到期日；纯函数，结果按 (symbol, 年份) 缓存。"""
+    match = _EXPIRY_DIGITS_RE.search(symbol)
+    if not match:
+        return None
+
+    digits = match.group(1)
+
+    if len(digits) == 4:
+        year_suffix = int(digits[:2])
+        month = int(digits[2:])
+        year = 2000 + year_suffix
+    elif len(digits) == 3:
+        # 郑商所三位代码只含年份末位，按当前年份补全年代；跨年后缓存键随之变化
+        year_suffix = int(digits[0])
+        month = int(digits[1:])
+        year = (current_year // 10) * 10 + year_suffix
+        if year < current_year - 1:
+            year += 10
+    else:
+        return None
+
+    try:
+        return date(year, month, 15)
+    except ValueError:
+        return None
+
+
 class ContractHelper:
     """
     合约工具类 (Infrastructure Layer)
@@ -13,6 +58,38 @@ class ContractHelper:
     3. 数据适配: 将合约列表转换为 Pandas DataFrame
     """
 
+    # 品种索引: (指纹, 合约列表副本, {品种代码: 合约元组} 只读视图)
+    # 网关每次返回新列表但合约对象稳定，以全部合约 id 组成的指纹识别同一合约全集；
+    # 副本持有合约引用，保证指纹中的 id 不被复用
+    _PRODUCT_INDEX: Optional[Tuple[Tuple[int, ...], List[Any], Mapping[str, Tuple[Any, ...]]]] = None
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """清空品种索引缓存。"""
+        cls._PRODUCT_INDEX = None
+
+    @staticmethod
+    def _get_option_index(
+        all_contracts: List[Any],
+    ) -> Tuple[List[Tuple[Any, str]], Dict[str, List[Tuple[Any, str]]]]:
+        """单次遍历筛出期权合约并按清洗后的交易所分桶。"""
+        all_options: List[Tuple[Any, str]] = []
+        by_exchange: Dict[str, List[Tuple[Any, str]]] = {}
+        for contract in all_contracts:
+            if not hasattr(contract, "option_type") and not hasattr(contract, "option_strike"):
+                continue
+
+            contract_exchange = getattr(contract, "exchange", None)
+            exchange_val = getattr(contract_exchange, "value", str(contract_exchange)) if contract_exchange else ""
+            if exchange_val and "Exchange." in exchange_val:
+                exchange_val = exchange_val.split(".")[-1]
+
+            item = (contract, getattr(contract, "symbol", "") or "")
+            all_options.append(item)
+            by_exchange.setdefault(exchange_val, []).append(item)
+
+        return all_options, by_exchange
+
     @staticmethod
     def get_option_chain(all_contracts: List[Any], underlying_vt_symbol: str, log_func: Optional[Callable] = None) -> pd.DataFrame:
         """
@@ -26,24 +103,44 @@ class ContractHelper:
         Returns:
             pd.DataFrame: 清洗后的期权链数据
         """
-        option_data = []
+        return ContractHelper._build_option_chain(all_contracts, underlying_vt_symbol, log_func)[0]
+
+    @staticmethod
+    def _build_option_chain(
+        all_contracts: List[Any],
+        underlying_vt_symbol: str,
+        log_func: Optional[Callable] = None,
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        # 按列累积后一次性构造 DataFrame，避免逐行 dict 的慢路径
+        vt_symbols: List[str] = []
+        symbols: List[str] = []
+        underlying_symbols: List[Any] = []
+        option_types: List[str] = []
+        strike_prices: List[float] = []
+        expiry_dates: List[str] = []
         for info in ContractHelper._iter_option_contract_infos(
             all_contracts=all_contracts,
             underlying_vt_symbol=underlying_vt_symbol,
             log_func=log_func,
         ):
-            option_data.append(
-                {
-                    "vt_symbol": info["vt_symbol"],
-                    "symbol": info["contract_symbol"],
-                    "underlying_symbol": info["contract_underlying"] or info["underlying_symbol"],
-                    "option_type": info["option_type"],
-                    "strike_price": info["strike_price"],
-                    "expiry_date": info["expiry_date"],
-                }
-            )
+            vt_symbols.append(info["vt_symbol"])
+            symbols.append(info["contract_symbol"])
+            underlying_symbols.append(info["contract_underlying"] or info["underlying_symbol"])
+            option_types.append(info["option_type"])
+            strike_prices.append(info["strike_price"])
+            expiry_dates.append(info["expiry_date"])
 
-        return pd.DataFrame(option_data)
+        chain = pd.DataFrame(
+            {
+                "vt_symbol": vt_symbols,
+                "symbol": symbols,
+                "underlying_symbol": underlying_symbols,
+                "option_type": option_types,
+                "strike_price": strike_prices,
+                "expiry_date": expiry_dates,
+            }
+        )
+        return chain, vt_symbols
 
     @staticmethod
     def _iter_option_contract_infos(
@@ -67,7 +164,7 @@ class ContractHelper:
                 symbol = underlying_vt_symbol
                 exchange_str = ""
 
-            match = re.match(r"^([a-zA-Z]+)(\d+)", symbol)
+            match = _PRODUCT_SUFFIX_RE.match(symbol)
             if not match:
                 return
 
@@ -86,63 +183,32 @@ class ContractHelper:
         def _infer_option_type_from_symbol(text: str) -> Optional[str]:
             if not text:
                 return None
-            base = text.split(".")[0]
-            m = re.search(r"-(C|P)-", base, flags=re.IGNORECASE)
-            if m:
-                return "call" if m.group(1).upper() == "C" else "put"
-            m = re.search(r"([CPcp])[-]?[0-9]+(?:\.[0-9]+)?$", base)
-            if m:
-                return "call" if m.group(1).upper() == "C" else "put"
-            return None
-
-        for contract in all_contracts:
-            if not hasattr(contract, "option_type") and not hasattr(contract, "option_strike"):
-                continue
+            m = _OPT_TYPE_RE.search(text.split(".")[0])
+            if not m:
+                return None
+            side = m.group("s1") or m.group("s2")
+            return "call" if side.upper() == "C" else "put"
 
-            contract_symbol = getattr(contract, "symbol", "") or ""
-            is_potential = contract_symbol.startswith(target_prefix)
+        all_options, options_by_exchange = ContractHelper._get_option_index(all_contracts)
+        candidates = options_by_exchange.get(exchange_str, ()) if exchange_str else all_options
 
-            contract_exchange = getattr(contract, "exchange", None)
-            exchange_val = getattr(contract_exchange, "value", str(contract_exchange)) if contract_exchange else ""
-            if exchange_val and "Exchange." in exchange_val:
-                try:
-                    exchange_val = exchange_val.split(".")[-1]
-                except IndexError:
-                    pass
-
-            if exchange_str and exchange_val != exchange_str:
-                # if is_potential and log_func:
-                #     log_func(
-                #         f"[调试-HELPER] 检查 {contract.vt_symbol} | 前缀匹配: 是 | 原始交易所: {contract_exchange} | "
-                #         f"清洗后值: '{exchange_val}' | 目标交易所: '{exchange_str}'"
-                #     )
-                #     log_func(f"[调试-HELPER] -> 已跳过，因交易所不匹配: '{exchange_val}' != '{exchange_str}'")
-                continue
+        symbol_upper = symbol.upper()
+        underlying_vt_upper = underlying_vt_symbol.upper()
 
+        for contract, contract_symbol in candidates:
             contract_underlying = getattr(contract, "underlying_symbol", None) or getattr(contract, "option_underlying", None)
 
-            should_include = False
-            if contract_underlying:
-                underlying_text = str(contract_underlying)
-                underlying_symbol_only = underlying_text.split(".")[0] if "." in underlying_text else underlying_text
-                if underlying_symbol_only.upper() == symbol.upper() or underlying_text.upper() == underlying_vt_symbol.upper():
-                    should_include = True
-
-            if not should_include and contract_symbol.startswith(target_prefix):
-                should_include = True
-                # if is_potential and log_func:
-                #     log_func(
-                #         f"[调试-HELPER] 检查 {contract.vt_symbol} | 前缀匹配: 是 | 原始交易所: {contract_exchange} | "
-                #         f"清洗后值: '{exchange_val}' | 目标交易所: '{exchange_str}'"
-                #     )
-                #     log_func(f"[调试-HELPER] -> 已纳入! 标的字段: {contract_underlying}")
-
-            if not should_include:
-                continue
+            # 前缀匹配最便宜，先判断；仅前缀不匹配时才解析标的字段
+            if not contract_symbol.startswith(target_prefix):
+                if not contract_underlying:
+                    continue
+                underlying_upper = str(contract_underlying).upper()
+                if underlying_upper.split(".", 1)[0] != symbol_upper and underlying_upper != underlying_vt_upper:
+                    continue
 
             strike_price = getattr(contract, "option_strike", 0)
             if not strike_price:
-                m = re.search(r"([CPcp])[-]?([0-9]+(?:\.[0-9]+)?)$", contract_symbol)
+                m = _STRIKE_TAIL_RE.search(contract_symbol)
                 if m:
                     strike_price = float(m.group(2))
 
@@ -198,11 +264,45 @@ class ContractHelper:
         判断合约是否属于指定品种
         """
         symbol = getattr(contract, "symbol", "")
-        match = re.match(r"^([a-zA-Z]+)", symbol)
+        match = _PRODUCT_PREFIX_RE.match(symbol)
         if match:
             return match.group(1).lower() == product_code.lower()
         return False
 
+    @staticmethod
+    def extract_product(contract: Any) -> str:
+        """
+        提取合约的品种代码 (小写)，无法解析时返回空字符串
+        """
+        match = _PRODUCT_PREFIX_RE.match(getattr(contract, "symbol", "") or "")
+        return match.group(1).lower() if match else ""
+
+    @staticmethod
+    def build_product_index(contracts: List[Any]) -> Mapping[str, Tuple[Any, ...]]:
+        """
+        单次遍历将合约按品种代码 (小写) 分桶，合约全集 (逐合约身份) 不变时复用上次结果
+
+        与 is_contract_of_product 判定一致: index.get(product.lower(), ()) 等价于逐合约过滤。
+        返回的索引为共享缓存的只读视图，桶为元组，调用方需修改时自行复制。
+        """
+        if not contracts:
+            return MappingProxyType({})
+
+        fingerprint = tuple(map(id, contracts))
+        cached = ContractHelper._PRODUCT_INDEX
+        if cached is not None and cached[0] == fingerprint:
+            return cached[2]
+
+        buckets: Dict[str, List[Any]] = {}
+        for contract in contracts:
+            product = ContractHelper.extract_product(contract)
+            if product:
+                buckets.setdefault(product, []).append(contract)
+
+        index = MappingProxyType({product: tuple(bucket) for product, bucket in buckets.items()})
+        ContractHelper._PRODUCT_INDEX = (fingerprint, list(contracts), index)
+        return index
+
     @staticmethod
     def get_expiry_from_symbol(symbol: str) -> Optional[date]:
         """
@@ -210,30 +310,14 @@ class ContractHelper:
         示例: rb2501 -> 2025-01-15 (估算)
              SA501 -> 2025-01-15 (估算)
         """
-        match = re.search(r"(\d{3,4})$", symbol)
-        if not match:
-            return None
-
-        digits = match.group(1)
-        current_year = date.today().year
-
-        if len(digits) == 4:
-            year_suffix = int(digits[:2])
-            month = int(digits[2:])
-            year = 2000 + year_suffix
-        elif len(digits) == 3:
-            year_suffix = int(digits[0])
-            month = int(digits[1:])
-            year = (current_year // 10) * 10 + year_suffix
-            if year < current_year - 1:
-                year += 10
-        else:
-            return None
+        return _parse_expiry(symbol, _CURRENT_YEAR)
 
-        try:
-            return date(year, month, 15)
-        except ValueError:
-            return None
+    @staticmethod
+    def refresh_current_year() -> int:
+        """刷新到期日解析所用的当前年份缓存，返回刷新后的年份。"""
+        global _CURRENT_YEAR
+        _CURRENT_YEAR = date.today().year
+        return _CURRENT_YEAR
 
     @staticmethod
     def extract_expiry_from_symbol(vt_symbol: str) -> str:
@@ -261,7 +345,7 @@ class ContractHelper:
             
             # 匹配 YYMM 格式的年月部分
             # 支持格式: IO2401-C-4000, m2509-C-2800, IO2401C4000 等
-            match = re.search(r"([a-zA-Z]+)(\d{4})", symbol)
+            match = _YYMM_RE.search(symbol)
             if match:
                 yymm = match.group(2)
                 return yymm
@@ -300,7 +384,7 @@ class ContractHelper:
             # 匹配行权价部分
             # 支持格式: IO2401-C-4000, m2509-C-2800, IO2401C4000 等
             # 使用更精确的模式：先匹配年月，然后匹配期权类型和行权价
-            match = re.search(r"\d{4}[-]?([CP])[-]?(\d+(?:\.\d+)?)", symbol, re.IGNORECASE)
+            match = _STRIKE_RANGE_RE.search(symbol)
             if not match:
                 return "unknown"
             
@@ -6,6 +6,7 @@
 设计决策:
 - maybe_save 接受 Callable 而非直接接受数据，实现惰性求值
 - 使用 time.monotonic() 计时，避免系统时钟调整的影响
+- 先以调用计数门控（按预期 Bar 周期折算），计数未到时不读取时钟
 - 保存失败时捕获异常并记录日志，不中断策略执行
 - 使用 digest 哈希检测状态变化，跳过重复保存
 - 使用 ThreadPoolExecutor(max_workers=1) 异步保存，避免阻塞 on_bars
@@ -37,6 +38,7 @@ class AutoSaveService:
         cleanup_interval_hours: float = 24.0,
         keep_days: int = 7,
         logger: Optional[Logger] = None,
+        expected_bar_seconds: float = 60.0,
     ) -> None:
         self._repository = state_repository
         self._strategy_name = strategy_name
@@ -44,6 +46,8 @@ class AutoSaveService:
         self._interval_seconds = interval_seconds
         self._logger = logger or getLogger(__name__)
         self._last_save_time: float = time.monotonic()
+        self._calls_since_save = 0
+        self._calls_per_save = max(1, int(interval_seconds / max(expected_bar_seconds, 1e-9)))
         self._last_digest: Optional[str] = None
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._pending_future: Optional[Future] = None
@@ -56,9 +60,17 @@ class AutoSaveService:
 
         snapshot_fn 是惰性求值，仅在需要保存时才调用，
         避免每次 on_bars 都执行序列化开销。
+
+        调用计数未达到 interval_seconds / expected_bar_seconds 时直接返回；
+        计数达到后仍以 monotonic 时钟兜底，防止 Bar 密集到达时过于频繁保存。
+        计数仅在保存真正完成判定 (提交或 digest 未变) 后清零，时钟未到时保留计数，
+        下一次调用继续检查时钟，避免丢弃整个计数周期。
         """
-        now = time.monotonic()
-        elapsed = now - self._last_save_time
+        self._calls_since_save += 1
+        if self._calls_since_save < self._calls_per_save:
+            return
+
+        elapsed = time.monotonic() - self._last_save_time
         if elapsed < self._interval_seconds:
             return
 
@@ -97,8 +109,9 @@ class AutoSaveService:
             )
 
     def reset(self) -> None:
-        """重置计时器。"""
+        """重置计时器与调用计数。"""
         self._last_save_time = time.monotonic()
+        self._calls_since_save = 0
 
     def _do_save(self, snapshot_fn: Callable[[], Dict[str, Any]]) -> None:
         """执行保存操作，失败时记录日志但不中断策略执行。
@@ -117,6 +130,7 @@ class AutoSaveService:
                     f"状态未变化 (digest={digest[:8]}...)，跳过保存 [{self._strategy_name}]"
                 )
                 self._last_save_time = time.monotonic()
+                self._calls_since_save = 0
                 return
             
             # 检查上一次异步保存是否完成
@@ -132,6 +146,7 @@ class AutoSaveService:
             )
             self._last_digest = digest
             self._last_save_time = time.monotonic()
+            self._calls_since_save = 0
             self._logger.debug(
                 f"已提交异步保存 (digest={digest[:8]}...) [{self._strategy_name}]"
             )
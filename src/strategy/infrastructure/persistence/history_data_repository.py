@@ -1,15 +1,31 @@
-from typing import List, Callable, Dict, Any, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from logging import Logger
 
+import pandas as pd
+
+# 预热列式读取: 单条 SQL 取回全部合约的 OHLCV 列，跳过 BarData 对象构造
+_BAR_COLUMNS_SQL = (
+    "SELECT symbol, exchange, datetime, open_price, high_price, low_price, close_price, volume "
+    "FROM dbbardata "
+    "WHERE \"interval\" = %s AND datetime >= %s AND datetime <= %s "
+    "AND (symbol, exchange) IN ({placeholders}) "
+    "ORDER BY symbol, exchange, datetime"
+)
+_BAR_FRAME_COLUMNS = ["symbol", "exchange", "datetime", "open", "high", "low", "close", "volume"]
+
+
 class HistoryDataRepository:
     """
     历史数据仓库
     
     负责从数据库加载历史数据并回放
     """
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, max_workers: int = 8):
         self.logger = logger
+        self.max_workers = max_workers
 
     def replay_bars_from_database(
         self, 
@@ -23,70 +39,213 @@ class HistoryDataRepository:
         Args:
             vt_symbols: 需要回放的合约代码列表
             days: 回放天数
-            on_bars_callback: Bar 数据回调函数 (接收 dict{vt_symbol: BarData})
+            on_bars_callback: Bar 数据回调函数 (接收 dict{vt_symbol: BarData})，
+                同一时间戳的多合约 Bar 合并为一次回调推送
             
         Returns:
             bool: 是否成功
         """
+        results = self._load_all(vt_symbols, days)
+        if results is None:
+            return False
+
+        ok = False
+        total_bars = 0
+        bars_by_dt: Dict[datetime, Dict[str, Any]] = defaultdict(dict)
+
+        for vt_symbol, bars in results:
+            if not bars:
+                continue
+
+            ok = True
+            total_bars += len(bars)
+            self.logger.info(f"Postgres warmup 加载成功: {vt_symbol}, bars={len(bars)}")
+            for bar in bars:
+                bars_by_dt[bar.datetime][vt_symbol] = bar
+
+        # 按时间戳分桶推送，同一时刻的多合约 Bar 一次性交给回调
+        for dt in sorted(bars_by_dt):
+            try:
+                on_bars_callback(bars_by_dt[dt])
+            except Exception:
+                self.logger.error(f"Postgres warmup 推送 bar 失败: {dt}", exc_info=True)
+                continue
+
+        self.logger.info(
+            f"Postgres warmup 完成: ok={ok}, total_bars={total_bars}, batches={len(bars_by_dt)}"
+        )
+        return ok
+
+    def load_bars_as_frames(self, vt_symbols: List[str], days: int) -> Dict[str, pd.DataFrame]:
+        """
+        批量加载历史 Bar 并按合约转换为 DataFrame
+
+        供预热批量灌入使用，跳过逐时间戳回调；每个 DataFrame 按时间升序，
+        列为 datetime, open, high, low, close, volume。
+
+        Args:
+            vt_symbols: 需要加载的合约代码列表
+            days: 加载天数
+
+        Returns:
+            Dict[str, pd.DataFrame]: {vt_symbol: K 线 DataFrame}，无数据的合约不包含在内
+        """
+        frames = self._query_bar_frames(vt_symbols, days)
+        if frames is not None:
+            for vt_symbol, frame in frames.items():
+                self.logger.info(f"Postgres warmup 加载成功: {vt_symbol}, bars={len(frame)}")
+            self.logger.info(
+                f"Postgres warmup 列式加载完成: symbols={len(frames)}, "
+                f"total_bars={sum(len(frame) for frame in frames.values())}"
+            )
+            return frames
+
+        results = self._load_all(vt_symbols, days)
+        if results is None:
+            return {}
+
+        frames: Dict[str, pd.DataFrame] = {}
+        for vt_symbol, bars in results:
+            if not bars:
+                continue
+
+            bars = sorted(bars, key=lambda bar: bar.datetime)
+            frames[vt_symbol] = pd.DataFrame(
+                {
+                    "datetime": [bar.datetime for bar in bars],
+                    "open": [bar.open_price for bar in bars],
+                    "high": [bar.high_price for bar in bars],
+                    "low": [bar.low_price for bar in bars],
+                    "close": [bar.close_price for bar in bars],
+                    "volume": [bar.volume for bar in bars],
+                }
+            )
+            self.logger.info(f"Postgres warmup 加载成功: {vt_symbol}, bars={len(bars)}")
+
+        self.logger.info(
+            f"Postgres warmup 批量加载完成: symbols={len(frames)}, "
+            f"total_bars={sum(len(frame) for frame in frames.values())}"
+        )
+        return frames
+
+    def _query_bar_frames(self, vt_symbols: List[str], days: int) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        单条 SQL 按列读取多合约分钟 Bar 并按合约切分为 DataFrame
+
+        过滤条件全部下推到 Postgres，结果按 (symbol, exchange, datetime) 有序返回，
+        省去逐合约往返与 BarData 构造。查询失败返回 None，由调用方回退逐合约加载。
+        """
+        from vnpy.trader.constant import Interval
+        from vnpy.trader.database import DB_TZ, get_database
+
+        pairs = [tuple(s.split(".", 1)) for s in vt_symbols if isinstance(s, str) and "." in s]
+        if not pairs:
+            return None
+
+        end = datetime.now()
+        start = end - timedelta(days=int(days))
+        try:
+            peewee_db = getattr(get_database(), "db", None)
+            if peewee_db is None:
+                return None
+            sql = _BAR_COLUMNS_SQL.format(placeholders=", ".join(["(%s, %s)"] * len(pairs)))
+            params = [Interval.MINUTE.value, start, end]
+            for symbol, exchange in pairs:
+                params.extend((symbol, exchange))
+            rows = peewee_db.execute_sql(sql, params).fetchall()
+        except Exception:
+            self.logger.warning("Postgres warmup 列式读取失败，回退逐合约加载", exc_info=True)
+            return None
+
+        frames: Dict[str, pd.DataFrame] = {}
+        if not rows:
+            return frames
+
+        data = pd.DataFrame.from_records(rows, columns=_BAR_FRAME_COLUMNS)
+        # 与 vn.py load_bar_data 一致，库中无时区的时间按 DB_TZ 解释
+        data["datetime"] = pd.to_datetime(data["datetime"]).dt.tz_localize(DB_TZ)
+        for (symbol, exchange), group in data.groupby(["symbol", "exchange"], sort=False):
+            frames[f"{symbol}.{exchange}"] = group.drop(columns=["symbol", "exchange"]).reset_index(drop=True)
+        return frames
+
+    def _load_all(self, vt_symbols: List[str], days: int) -> Optional[List[Tuple[str, List[Any]]]]:
+        """
+        并发加载多个合约最近 days 天的分钟 Bar
+
+        Returns:
+            [(vt_symbol, bars)] 列表；无可用合约或数据库初始化失败时返回 None
+        """
         from vnpy.trader.database import get_database
-        from vnpy.trader.constant import Interval, Exchange
 
         # 过滤无效 symbol
         vt_symbols = [s for s in vt_symbols if isinstance(s, str) and s]
         if not vt_symbols:
             self.logger.error("Postgres warmup 回放失败: 没有可用的 vt_symbol 列表")
-            return False
+            return None
 
         try:
             db = get_database()
         except Exception:
             self.logger.error("Postgres warmup 回放失败: 初始化 vn.py DatabaseManager 失败", exc_info=True)
-            return False
+            return None
 
         end = datetime.now()
         start = end - timedelta(days=int(days))
 
         self.logger.info(f"Postgres warmup 开始: days={days}, symbols={len(vt_symbols)}, range={start} ~ {end}")
 
-        ok = False
-        total_bars = 0
-        for vt_symbol in vt_symbols:
-            if "." not in vt_symbol:
-                self.logger.warning(f"Postgres warmup 跳过无效 vt_symbol: {vt_symbol}")
-                continue
-
-            symbol_part, exchange_str = vt_symbol.split(".", 1)
-            try:
-                exchange = Exchange(exchange_str)
-            except Exception:
-                self.logger.warning(f"Postgres warmup 跳过无法解析交易所: {vt_symbol}")
-                continue
+        # 各合约读取互不依赖，并发发起以重叠数据库 I/O 等待；
+        # vn.py 的 peewee 连接按线程持有，每个工作线程各自建连，读取后在 _load_symbol 中关闭
+        max_workers = max(1, min(self.max_workers, len(vt_symbols)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda s: self._load_symbol(db, s, start, end), vt_symbols)
+            )
 
-            try:
-                bars = db.load_bar_data(
-                    symbol=symbol_part,
-                    exchange=exchange,
-                    interval=Interval.MINUTE,
-                    start=start,
-                    end=end,
-                )
-            except Exception:
-                self.logger.error(f"Postgres warmup 读取 bar 失败: {vt_symbol}", exc_info=True)
-                continue
+    def _load_symbol(
+        self,
+        db: Any,
+        vt_symbol: str,
+        start: datetime,
+        end: datetime,
+    ) -> Tuple[str, List[Any]]:
+        """
+        加载单个合约的历史 Bar
+
+        解析失败、读取异常或无数据时记录日志并返回空列表。
+        在线程池工作线程中执行，返回前关闭本线程打开的数据库连接，避免每次预热泄漏连接。
+        """
+        from vnpy.trader.constant import Interval, Exchange
 
-            if not bars:
-                self.logger.warning(f"Postgres warmup 无数据: {vt_symbol}")
-                continue
+        if "." not in vt_symbol:
+            self.logger.warning(f"Postgres warmup 跳过无效 vt_symbol: {vt_symbol}")
+            return vt_symbol, []
+
+        symbol_part, exchange_str = vt_symbol.split(".", 1)
+        try:
+            exchange = Exchange(exchange_str)
+        except Exception:
+            self.logger.warning(f"Postgres warmup 跳过无法解析交易所: {vt_symbol}")
+            return vt_symbol, []
+
+        try:
+            bars = db.load_bar_data(
+                symbol=symbol_part,
+                exchange=exchange,
+                interval=Interval.MINUTE,
+                start=start,
+                end=end,
+            )
+        except Exception:
+            self.logger.error(f"Postgres warmup 读取 bar 失败: {vt_symbol}", exc_info=True)
+            return vt_symbol, []
+        finally:
+            peewee_db = getattr(db, "db", None)
+            if peewee_db is not None and not peewee_db.is_closed():
+                peewee_db.close()
 
-            ok = True
-            total_bars += len(bars)
-            self.logger.info(f"Postgres warmup 加载成功: {vt_symbol}, bars={len(bars)}")
-            for bar in bars:
-                try:
-                    on_bars_callback({vt_symbol: bar})
-                except Exception:
-                    self.logger.error(f"Postgres warmup 推送 bar 失败: {vt_symbol}", exc_info=True)
-                    continue
+        if not bars:
+            self.logger.warning(f"Postgres warmup 无数据: {vt_symbol}")
+            return vt_symbol, []
 
-        self.logger.info(f"Postgres warmup 完成: ok={ok}, total_bars={total_bars}")
-        return ok
+        return vt_symbol, bars
@@ -16,7 +16,7 @@ import importlib
 import json
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import pandas as pd
 
@@ -148,17 +148,25 @@ class JsonSerializer:
         - set → list
         - Enum → value
         - dataclass → dict
+        - 使用紧凑分隔符，不输出多余空格，减小快照体积
         """
         payload = (
             {"schema_version": CURRENT_SCHEMA_VERSION, **data}
             if inject_schema_version
             else data
         )
-        return json.dumps(payload, cls=_CustomEncoder, ensure_ascii=False, sort_keys=True)
+        return json.dumps(
+            payload,
+            cls=_CustomEncoder,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
 
-    def deserialize(self, json_str: str) -> Dict[str, Any]:
+    def deserialize(self, json_str: Union[str, bytes]) -> Dict[str, Any]:
         """从 JSON 字符串反序列化。
 
+        - 同时接受 str 与 UTF-8 bytes，StateRepository 解压后的 bytes 无需先解码
         - records 格式 → DataFrame
         - ISO 8601 字符串 → datetime
         """
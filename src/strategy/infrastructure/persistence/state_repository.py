@@ -31,6 +31,14 @@ from src.strategy.infrastructure.persistence.model.strategy_state_po import (
 
 COMPRESSION_PREFIX = "ZLIB:"
 DEFAULT_COMPRESSION_THRESHOLD = 10 * 1024  # 10KB
+# 快照 JSON 重复度高，低档位压缩率已接近默认档 6，耗时仅其一半左右（on_stop 同步保存路径）
+COMPRESSION_LEVEL = 3
+
+# 单条快照写入走预构建 SQL，绕过 Peewee 字段转换层（列类型均为基础类型）
+_INSERT_SNAPSHOT_SQL = (
+    "INSERT INTO strategy_state (strategy_name, snapshot_json, schema_version, saved_at) "
+    "VALUES (%s, %s, %s, %s)"
+)
 
 
 def decode_stored_snapshot(stored: str) -> str:
@@ -64,6 +72,21 @@ class StateRepository:
         self._database_factory = database_factory
         self._logger = logger
         self._compression_threshold = compression_threshold
+        self._db: Optional[Any] = None
+
+    def _ensure_bound(self) -> Any:
+        """首次访问时获取 Peewee 连接并绑定到 PO 模型，之后复用。
+
+        延迟到首次读写时才绑定，避免回测等不落库场景提前建立数据库连接。
+        """
+        if self._db is None:
+            self.rebind()
+        return self._db
+
+    def rebind(self) -> None:
+        """重新从工厂获取 Peewee 连接并绑定到 PO 模型（如重连后显式调用）。"""
+        self._db = self._database_factory.get_peewee_db()
+        StrategyStatePO._meta.database = self._db
 
     def save(self, strategy_name: str, data: Dict[str, Any]) -> None:
         """保存状态到数据库（INSERT 追加）。
@@ -82,14 +105,11 @@ class StateRepository:
         """
         stored_data, compressed = self._maybe_compress(json_str)
 
-        db = self._database_factory.get_peewee_db()
-        StrategyStatePO._meta.database = db
+        db = self._ensure_bound()
 
-        StrategyStatePO.create(
-            strategy_name=strategy_name,
-            snapshot_json=stored_data,
-            schema_version=CURRENT_SCHEMA_VERSION,
-            saved_at=datetime.now(),
+        db.execute_sql(
+            _INSERT_SNAPSHOT_SQL,
+            (strategy_name, stored_data, CURRENT_SCHEMA_VERSION, datetime.now()),
         )
 
         if self._logger:
@@ -105,23 +125,17 @@ class StateRepository:
         - 记录存在但 JSON 反序列化失败 → 抛出 CorruptionError
         - 成功 → 返回 Dict
         """
-        db = self._database_factory.get_peewee_db()
-        StrategyStatePO._meta.database = db
+        self._ensure_bound()
 
-        record = (
-            StrategyStatePO.select()
-            .where(StrategyStatePO.strategy_name == strategy_name)
-            .order_by(StrategyStatePO.saved_at.desc())
-            .first()
-        )
+        stored = self._select_latest_snapshot(strategy_name)
 
-        if record is None:
+        if stored is None:
             if self._logger:
                 self._logger.debug(f"未找到策略状态记录: {strategy_name}")
             return ArchiveNotFound(strategy_name=strategy_name)
 
         try:
-            json_str = self._maybe_decompress(record.snapshot_json)
+            json_str = self._maybe_decompress(stored)
             data = self._serializer.deserialize(json_str)
         except Exception as e:
             raise CorruptionError(
@@ -134,26 +148,35 @@ class StateRepository:
 
     def verify_integrity(self, strategy_name: str) -> bool:
         """验证最新记录完整性：检查 JSON 可解析且包含 schema_version。"""
-        db = self._database_factory.get_peewee_db()
-        StrategyStatePO._meta.database = db
+        self._ensure_bound()
 
-        record = (
-            StrategyStatePO.select()
-            .where(StrategyStatePO.strategy_name == strategy_name)
-            .order_by(StrategyStatePO.saved_at.desc())
-            .first()
-        )
+        stored = self._select_latest_snapshot(strategy_name)
 
-        if record is None:
+        if stored is None:
             return False
 
         try:
-            json_str = self._maybe_decompress(record.snapshot_json)
+            json_str = self._maybe_decompress(stored)
             parsed = json.loads(json_str)
         except Exception:
             return False
 
         return "schema_version" in parsed
+
+    def _select_latest_snapshot(self, strategy_name: str) -> Optional[str]:
+        """只查询最新一条记录的 snapshot_json 列。
+
+        以 scalar() 取回原始列值，跳过 PO 实例构造与其余列的解码，
+        大快照只在内存中保留一份驱动返回的字符串；
+        查询由 (strategy_name, saved_at) 复合索引定位，btree 可反向扫描满足 DESC 排序。
+        """
+        return (
+            StrategyStatePO.select(StrategyStatePO.snapshot_json)
+            .where(StrategyStatePO.strategy_name == strategy_name)
+            .order_by(StrategyStatePO.saved_at.desc())
+            .limit(1)
+            .scalar()
+        )
 
     def _maybe_compress(self, json_str: str) -> tuple[str, bool]:
         """超过阈值时压缩，压缩后更大则保留原始。
@@ -173,7 +196,7 @@ class StateRepository:
             return json_str, False
         
         # 尝试压缩
-        compressed = zlib.compress(raw_bytes)
+        compressed = zlib.compress(raw_bytes, COMPRESSION_LEVEL)
         
         # 压缩后更大，保留原始
         if len(compressed) >= len(raw_bytes):
@@ -183,21 +206,21 @@ class StateRepository:
         encoded = base64.b64encode(compressed).decode("ascii")
         return COMPRESSION_PREFIX + encoded, True
 
-    def _maybe_decompress(self, stored: str) -> str:
+    def _maybe_decompress(self, stored: str) -> Union[str, bytes]:
         """检测前缀并解压。
 
         Args:
             stored: 存储的数据（可能含 ZLIB: 前缀）
 
         Returns:
-            str: 解压后的 JSON 字符串
+            Union[str, bytes]: 压缩数据返回解压后的 UTF-8 JSON bytes（json.loads 直接解析，
+            省去对整段大快照的一次解码与拷贝）；未压缩数据原样返回字符串
         """
         if stored.startswith(COMPRESSION_PREFIX):
             # 移除前缀，base64 解码，zlib 解压
             encoded = stored[len(COMPRESSION_PREFIX):]
             compressed = base64.b64decode(encoded)
-            raw_bytes = zlib.decompress(compressed)
-            return raw_bytes.decode("utf-8")
+            return zlib.decompress(compressed)
         
         # 未压缩，直接返回
         return stored
@@ -215,8 +238,7 @@ class StateRepository:
         Returns:
             int: 删除的记录数
         """
-        db = self._database_factory.get_peewee_db()
-        StrategyStatePO._meta.database = db
+        self._ensure_bound()
 
         # 先查询最新记录 ID
         latest = (
@@ -7,15 +7,32 @@ FeishuEventHandler - 飞书事件处理器
 - 通过 EventEngine.register() 订阅事件
 - 处理 StrategyAlertData 类型的事件
 - 发送格式化的飞书消息
+- 事件线程只负责入队，HTTP 发送由后台线程完成，避免阻塞 EventEngine
+- 突发告警在 1 秒窗口内合并为一条消息，减少 Webhook 请求与限流丢弃
 """
 from typing import Any, Optional
-from datetime import datetime
 import json
+import queue
+import string
+import threading
+import time
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # 未安装 requests 时禁用飞书发送
+    requests = None
 
 from ...domain.event.event_types import StrategyAlertData, EVENT_STRATEGY_ALERT
 from ..logging.logging_utils import setup_strategy_logger
 
 
+def _template_fields(template: str) -> frozenset:
+    """解析模板中引用的占位符名称。"""
+    return frozenset(name for _, name, _, _ in string.Formatter().parse(template) if name)
+
+
 class FeishuEventHandler:
     """
     飞书事件处理器
@@ -36,6 +53,13 @@ class FeishuEventHandler:
     ```
     """
     
+    # 发送队列上限，突发告警超出时丢弃并记录日志
+    QUEUE_MAX_SIZE = 100
+
+    # 批量窗口: 首条消息到达后最多等待该秒数，合并为一条飞书消息发送
+    BATCH_WINDOW_SECONDS = 1.0
+    BATCH_MAX_SIZE = 10
+
     # 消息模板
     MESSAGE_TEMPLATES = {
         "manual_open": "⚠️ 检测到手动开仓 {vt_symbol} {volume}手，程序不会自动平仓",
@@ -50,6 +74,13 @@ class FeishuEventHandler:
         "warning": "🟡 策略警告: {message}",
         "info": "ℹ️ {message}",
     }
+
+    # 只引用 {message} 的模板，格式化时直接字符串替换，无需 kwargs 展开
+    _MESSAGE_ONLY_TEMPLATES = frozenset(
+        alert_type
+        for alert_type, template in MESSAGE_TEMPLATES.items()
+        if _template_fields(template) <= {"message"}
+    )
     
     def __init__(
         self,
@@ -67,15 +98,30 @@ class FeishuEventHandler:
         """
         self.webhook_url = webhook_url
         self.strategy_name = strategy_name
-        self.enabled = enabled
+        self.enabled = enabled and requests is not None
         
         # 初始化日志
         # 复用策略的日志配置
         self.logger = setup_strategy_logger(strategy_name, "strategy.log")
+        if enabled and requests is None:
+            self.logger.warning("[飞书处理] 未安装 requests，飞书告警已禁用")
 
         # 发送限流 (避免频繁发送)
-        self._last_send_time: Optional[datetime] = None
+        # 使用 monotonic 时钟，不受 NTP 校时/系统时间调整影响
+        self._last_send_time: Optional[float] = None
         self._min_interval_seconds = 5
+
+        # 复用 HTTP 连接 (首次发送时创建)，避免每条告警都重新 TCP + TLS 握手
+        self._session: Optional[Any] = None
+
+        # 有界发送队列 + 后台发送线程 (None 为停止哨兵)
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=self.QUEUE_MAX_SIZE)
+        self._worker = threading.Thread(
+            target=self._drain,
+            name=f"feishu-{strategy_name}",
+            daemon=True,
+        )
+        self._worker.start()
     
     def handle_alert_event(self, event: Any) -> None:
         """
@@ -99,8 +145,11 @@ class FeishuEventHandler:
             # 格式化消息
             message = self._format_message(data)
             
-            # 发送飞书
-            self._send_feishu(message)
+            # 入队，由后台线程发送飞书
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                self.logger.warning(f"[飞书处理] 发送队列已满，丢弃消息: {message}")
             
         except Exception as e:
             # 避免日志循环，这里只简单打印
@@ -116,7 +165,11 @@ class FeishuEventHandler:
         Returns:
             格式化后的消息字符串
         """
-        template = self.MESSAGE_TEMPLATES.get(data.alert_type, "{message}")
+        template = self.MESSAGE_TEMPLATES.get(data.alert_type)
+        if template is None:
+            return str(data.message)
+        if data.alert_type in self._MESSAGE_ONLY_TEMPLATES:
+            return template.replace("{message}", str(data.message))
         
         try:
             message = template.format(
@@ -131,26 +184,103 @@ class FeishuEventHandler:
         
         return message
     
-    def _send_feishu(self, message: str) -> bool:
+    def _drain(self) -> None:
+        """后台线程: 按批量窗口合并消息后发送，收到 None 哨兵时发完当前批次并退出。"""
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            batch = [message]
+            stopping = self._collect_batch(batch)
+            # 限流窗口未结束时等待其重新打开，而非整批丢弃
+            stopping = self._wait_send_window(batch, stopping)
+            try:
+                self._send_feishu("\n".join(batch), alert_count=len(batch))
+            except Exception as e:
+                self.logger.error(f"[飞书处理] 后台发送异常: {e}")
+            if stopping:
+                return
+
+    def _collect_batch(self, batch: list) -> bool:
+        """在批量窗口内继续收集消息，达到上限或窗口结束即返回；返回是否收到停止哨兵。"""
+        deadline = time.monotonic() + self.BATCH_WINDOW_SECONDS
+        while len(batch) < self.BATCH_MAX_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                message = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            if message is None:
+                return True
+            batch.append(message)
+        return False
+
+    def _wait_send_window(self, batch: list, stopping: bool) -> bool:
+        """等待限流窗口重新打开，期间到达的消息并入本批 (不超过批量上限)；返回是否已收到停止哨兵。"""
+        if self._last_send_time is None:
+            return stopping
+        deadline = self._last_send_time + self._min_interval_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return stopping
+            if stopping or len(batch) >= self.BATCH_MAX_SIZE:
+                time.sleep(remaining)
+                return stopping
+            try:
+                message = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return stopping
+            if message is None:
+                stopping = True
+                continue
+            batch.append(message)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """停止后台发送线程；队列中已有消息会先发送完毕（至多等待 timeout 秒）。"""
+        if not self._worker.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._worker.join(timeout=timeout)
+
+    def _get_session(self) -> Any:
+        """获取带连接池的 requests.Session（惰性创建并复用）。"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=1, backoff_factor=0.1),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def _send_feishu(self, message: str, alert_count: int = 1) -> bool:
         """
         发送飞书消息
         
         Args:
             message: 要发送的消息
+            alert_count: 消息合并的告警条数 (用于丢弃时的日志)
             
         Returns:
             True 如果发送成功
         """
-        # 限流检查
-        now = datetime.now()
-        if self._last_send_time:
-            elapsed = (now - self._last_send_time).total_seconds()
-            if elapsed < self._min_interval_seconds:
-                return False
+        # 限流检查 (后台线程发送前已等待窗口，此处兜底)
+        now = time.monotonic()
+        if self._last_send_time is not None and now - self._last_send_time < self._min_interval_seconds:
+            self.logger.warning(f"[飞书处理] 限流窗口内，丢弃 {alert_count} 条告警")
+            return False
         
-        import requests
-
         try:
+            session = self._get_session()
             payload = {
                 "msg_type": "text",
                 "content": {
@@ -158,15 +288,21 @@ class FeishuEventHandler:
                 }
             }
             
-            response = requests.post(
+            response = session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=5
             )
             
+            if response.status_code != 200:
+                self.logger.warning(
+                    f"[飞书处理] 发送失败 status={response.status_code}，丢弃 {alert_count} 条告警"
+                )
+                return False
+
+            # 仅成功发送才推进限流窗口
             self._last_send_time = now
-            
-            return response.status_code == 200
+            return True
             
         except Exception as e:
             self.logger.error(f"[飞书处理] 发送失败: {e}")
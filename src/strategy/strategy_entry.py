@@ -7,11 +7,11 @@ on_* 回调直接编排领域逻辑，不再经过独立的 Application Service
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 import os
-from typing import Any, Dict, List, Optional, Set
+from pathlib import PureWindowsPath
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
-from vnpy.event.engine import Event
 from vnpy.trader.object import BarData, OrderData, PositionData, TickData, TradeData
 from vnpy_portfoliostrategy import StrategyEngine, StrategyTemplate
 
@@ -43,9 +43,25 @@ from .infrastructure.persistence.auto_save_service import AutoSaveService
 from .infrastructure.persistence.history_data_repository import HistoryDataRepository
 from .infrastructure.persistence.json_serializer import JsonSerializer
 from .infrastructure.persistence.state_repository import StateRepository
-from .infrastructure.reporting.feishu_handler import FeishuEventHandler
 from .infrastructure.subscription.subscription_mode_engine import SubscriptionModeEngine
 
+if TYPE_CHECKING:
+    from .infrastructure.reporting.feishu_handler import FeishuEventHandler
+
+
+def _resolve_log_filename(log_dir_setting: str) -> str:
+    """将 log_dir 配置映射为 logs/runner 下的相对日志名，未指向 logs/runner 时使用默认名。"""
+    # PureWindowsPath 同时识别 / 与 \ 分隔符，按路径段匹配无需手工替换
+    parts = PureWindowsPath(log_dir_setting).parts if log_dir_setting else ()
+    lowered = [part.lower() for part in parts]
+    for index in range(len(lowered) - 1):
+        if lowered[index] == "logs" and lowered[index + 1] == "runner":
+            relative_parts = parts[index + 2 :]
+            if relative_parts:
+                return os.path.join(*relative_parts, "strategy")
+            break
+    return "strategy"
+
 
 class StrategyEntry(StrategyTemplate):
     """
@@ -89,17 +105,7 @@ class StrategyEntry(StrategyTemplate):
         super().__init__(strategy_engine, strategy_name, vt_symbols, setting)
 
         # ── 日志 ──
-        log_dir_setting = str(setting.get("log_dir", "") or "")
-        log_filename = "strategy"
-        if log_dir_setting:
-            normalized_log_dir = log_dir_setting.replace("\\", "/")
-            marker = "logs/runner"
-            relative_log_dir = ""
-            marker_index = normalized_log_dir.lower().find(marker)
-            if marker_index != -1:
-                relative_log_dir = normalized_log_dir[marker_index + len(marker) :].strip("/")
-            if relative_log_dir:
-                log_filename = os.path.join(*relative_log_dir.split("/"), "strategy")
+        log_filename = _resolve_log_filename(str(setting.get("log_dir", "") or ""))
         self.logger = setup_strategy_logger(self.strategy_name, log_filename)
 
         # ── 基础设施: 历史数据仓库 ──
@@ -109,6 +115,7 @@ class StrategyEntry(StrategyTemplate):
         self.paper_trading = setting.get("paper_trading", False)
         self.backtesting = setting.get("backtesting", False)
         self.warmup_days: int = int(setting.get("warmup_days", 5 if self.backtesting else 30))
+        self.snapshot_interval_sec: float = float(setting.get("snapshot_interval_sec", 30))
 
         # ── 领域聚合根 (在 on_init 中初始化) ──
         self.target_aggregate: Optional[InstrumentManager] = None
@@ -159,12 +166,11 @@ class StrategyEntry(StrategyTemplate):
         self._last_subscription_refresh_ts: float = 0.0
 
         # ── 运行时状态 ──
-        self.rollover_check_done: bool = False
-        self.universe_check_interval: int = 0
-        self.universe_check_threshold: int = 60
+        self.last_rollover_check_date: Optional[date] = None
+        self.last_universe_check_dt: Optional[datetime] = None
         self.last_bars: Dict[str, BarData] = {}
         self.warming_up: bool = False
-        self.current_dt: datetime = datetime.now()
+        self.current_dt: Optional[datetime] = None  # 首根 K 线或状态恢复时赋值
         self.last_decision_trace: Optional[DecisionTrace] = None
 
         # ── 应用层切片 ──
@@ -174,6 +180,13 @@ class StrategyEntry(StrategyTemplate):
         self.state_workflow = StateWorkflow(self)
         self.event_bridge = EventBridge(self)
 
+        # 高频回调预绑定: 切片生命周期与策略实例一致，省去每次回调的二级属性查找
+        self._handle_tick = self.market_workflow.on_tick
+        self._handle_bars = self.market_workflow.on_bars
+        self._handle_order = self.event_bridge.on_order
+        self._handle_trade = self.event_bridge.on_trade
+        self._handle_position = self.event_bridge.on_position
+
     # ═══════════════════════════════════════════════════════════════════
     #  VnPy 生命周期回调
     # ═══════════════════════════════════════════════════════════════════
@@ -192,22 +205,19 @@ class StrategyEntry(StrategyTemplate):
     # ═══════════════════════════════════════════════════════════════════
 
     def on_tick(self, tick: TickData) -> None:
-        self.market_workflow.on_tick(tick)
+        self._handle_tick(tick)
 
     def on_bars(self, bars: Dict[str, BarData]) -> None:
-        self.market_workflow.on_bars(bars)
+        self._handle_bars(bars)
 
     def on_order(self, order: OrderData) -> None:
-        self.event_bridge.on_order(order)
+        self._handle_order(order)
 
     def on_trade(self, trade: TradeData) -> None:
-        self.event_bridge.on_trade(trade)
-
-    def process_position_event(self, event: Event) -> None:
-        self.event_bridge.process_position_event(event)
+        self._handle_trade(trade)
 
     def on_position(self, position: PositionData) -> None:
-        self.event_bridge.on_position(position)
+        self._handle_position(position)
 
     # ═══════════════════════════════════════════════════════════════════
     #  核心编排逻辑委托
@@ -266,8 +276,8 @@ class StrategyEntry(StrategyTemplate):
     def _create_snapshot(self) -> Dict[str, Any]:
         return self.state_workflow.create_snapshot()
 
-    def _record_snapshot(self) -> None:
-        self.state_workflow.record_snapshot()
+    def _record_snapshot(self, force: bool = False) -> None:
+        self.state_workflow.record_snapshot(force)
 
     # ═══════════════════════════════════════════════════════════════════
     #  事件桥接委托
@@ -1,12 +1,9 @@
 import os
 import sys
-import glob
-import pickle
 import json
 import re
 from contextlib import contextmanager
 from threading import Lock
-import pandas as pd
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -555,180 +552,6 @@ class StrategyStateReader:
                 pass
 
 
-class SnapshotReader:
-    def __init__(self, monitor_dir="data/monitor"):
-        # 将项目根目录添加到 sys.path 以允许反序列化策略对象
-        # src/web -> src -> 项目根目录
-        self.monitor_dir = os.path.join(project_root, monitor_dir)
-
-    @staticmethod
-    def extract_delivery_month(vt_symbol):
-        """
-        从合约代码中提取到期月份
-        支持格式: 
-        - pp2601.DCE -> 2601
-        - SH601.CZCE -> 601 -> 2601 (补全)
-        """
-        try:
-            # 提取 symbol 部分 (去掉 .交易所)
-            symbol = vt_symbol.split('.')[0]
-            
-            # 1. 尝试匹配 4 位数字 (如 2601) - 放在前面优先匹配
-            # 这里的正则意味着：字母开头 + 2 + 3位数字
-            match_4 = re.search(r'[a-zA-Z]+(2\d{3})', symbol)
-            if match_4:
-                return match_4.group(1) 
-                
-            # 2. 尝试匹配 3 位数字 (如 601) - 放在后面
-            # 这里的正则意味着：字母开头 + 6/7/8/9 + 2位数字
-            match_3 = re.search(r'[a-zA-Z]+([6-9]\d{2})', symbol)
-            if match_3:
-                # 补全为 4 位，例如 601 -> 2601
-                short_month = match_3.group(1)
-                return "2" + short_month 
-        except Exception:
-            pass
-            
-        return "Other"
-
-    def list_available_strategies(self):
-        """扫描目录下所有的 snapshot_*.pkl"""
-        pattern = os.path.join(self.monitor_dir, "snapshot_*.pkl")
-        files = glob.glob(pattern)
-        strategies = []
-        for f in files:
-            try:
-                # snapshot_15m.pkl -> 15m
-                basename = os.path.basename(f)
-                variant = basename.replace("snapshot_", "").replace(".pkl", "")
-                
-                # 获取最后修改时间
-                mtime = os.path.getmtime(f)
-                dt = datetime.fromtimestamp(mtime)
-                
-                strategies.append({
-                    "variant": variant,
-                    "last_update": dt.strftime("%Y-%m-%d %H:%M:%S"),
-                    "file_size": os.path.getsize(f)
-                })
-            except Exception:
-                continue
-        return strategies
-
-    def get_strategy_data(self, variant_name):
-        """读取指定变体的快照并转换为 JSON"""
-        file_path = os.path.join(self.monitor_dir, f"snapshot_{variant_name}.pkl")
-        
-        if not os.path.exists(file_path):
-            return None
-
-        try:
-            with open(file_path, "rb") as f:
-                raw_data = pickle.load(f)
-        except Exception as e:
-            print(f"Error loading pickle: {e}")
-            return None
-
-        if isinstance(raw_data, dict) and "timestamp" in raw_data and "instruments" in raw_data:
-            return raw_data
-
-        # 数据清洗
-        return {
-            "timestamp": raw_data["update_time"].strftime("%Y-%m-%d %H:%M:%S"),
-            "variant": raw_data["variant"],
-            "instruments": self._parse_instruments(raw_data["instruments"]),
-            "positions": self._parse_positions(raw_data["positions"]),
-            "orders": self._parse_orders(raw_data["positions"])
-        }
-
-    def _parse_instruments(self, aggregate):
-        """解析标的数据（通用格式，不依赖具体策略逻辑）"""
-        result = {}
-
-        for symbol in aggregate.get_all_symbols():
-            instrument = aggregate.get_instrument(symbol)
-            if not instrument:
-                continue
-
-            # 获取 K 线数据 - 支持 DataFrame 和 deque 两种格式
-            ohlc = []
-            dates = []
-            volumes = []
-
-            if hasattr(instrument, "bars") and isinstance(instrument.bars, pd.DataFrame):
-                bars_df = instrument.bars
-                if bars_df.empty:
-                    continue
-                for _idx, row in bars_df.iterrows():
-                    dt = row.get("datetime")
-                    dt_str = dt if isinstance(dt, str) else (dt.strftime("%Y-%m-%d %H:%M:%S") if dt else "")
-                    dates.append(dt_str)
-                    ohlc.append([row.get("open"), row.get("close"), row.get("low"), row.get("high")])
-                    volumes.append(row.get("volume", 0))
-            elif hasattr(instrument, "bar_history"):
-                bars = list(instrument.bar_history)
-                if not bars:
-                    continue
-                for bar in bars:
-                    dates.append(bar.datetime.strftime("%Y-%m-%d %H:%M:%S"))
-                    ohlc.append([bar.open_price, bar.close_price, bar.low_price, bar.high_price])
-                    volumes.append(bar.volume)
-            else:
-                continue
-
-            # 指标数据由具体策略实现决定，web 层不做假设
-            indicator_data = getattr(instrument, "indicators", {})
-
-            result[symbol] = {
-                "dates": dates,
-                "ohlc": ohlc,
-                "volumes": volumes,
-                "indicators": indicator_data,
-                "last_price": instrument.latest_close,
-                "delivery_month": self.extract_delivery_month(symbol),
-            }
-        return result
-
-    def _parse_positions(self, position_aggregate):
-        # PositionAggregate 包含 positions 字典
-        result = []
-        for pos in position_aggregate.get_all_positions():
-            result.append({
-                "vt_symbol": pos.vt_symbol,
-                "direction": str(pos.direction),
-                "volume": pos.volume,
-                "price": pos.open_price,
-                "pnl": 0.0
-            })
-        return result
-
-    def _parse_orders(self, position_aggregate):
-        # PositionAggregate 包含 pending_orders 字典
-        result = []
-        # 使用新的 getter 或回退到受保护成员（如果是旧 pickle）
-        if hasattr(position_aggregate, "get_all_pending_orders"):
-            orders = position_aggregate.get_all_pending_orders()
-        else:
-            orders = position_aggregate._pending_orders.values()
-
-        for order in orders:
-            result.append({
-                "vt_orderid": order.vt_orderid,
-                "vt_symbol": order.vt_symbol,
-                "direction": str(order.direction),
-                "offset": str(order.offset),
-                "volume": order.volume,
-                "price": order.price,
-                "status": str(order.status) if hasattr(order, "status") else "Unknown"
-            })
-        return result
-
-
-
-
-
-
-
 class PostgresSnapshotReader:
     def __init__(self):
         self.instance_id = os.getenv("MONITOR_INSTANCE_ID", "default") or "default"
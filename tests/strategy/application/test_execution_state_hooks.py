@@ -53,15 +53,8 @@ def test_state_workflow_does_not_dump_execution_state_without_hooks() -> None:
     assert "execution_state" not in snapshot
 
 
-def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatch) -> None:
-    calls: list[str] = []
-    runtime = SimpleNamespace(
-        lifecycle=SimpleNamespace(init_hooks=[]),
-        state=SimpleNamespace(restore_hooks=[lambda entry: calls.append(f"restore:{entry.strategy_name}")]),
-    )
-    service_cls = type("Service", (), {"__init__": lambda self, **kwargs: None})
-
-    entry = SimpleNamespace(
+def _lifecycle_entry(**overrides) -> SimpleNamespace:
+    entry = dict(
         logger=SimpleNamespace(
             info=lambda *a, **k: None,
             warning=lambda *a, **k: None,
@@ -81,6 +74,7 @@ def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatc
         backtesting=False,
         warmup_days=1,
         history_repo=SimpleNamespace(replay_bars_from_database=lambda **kwargs: True),
+        bar_pipeline=None,
         feishu_webhook="",
         vt_symbols=[],
         trading=True,
@@ -89,7 +83,11 @@ def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatc
         _validate_universe=lambda: None,
         on_bars=lambda bars: None,
     )
+    entry.update(overrides)
+    return SimpleNamespace(**entry)
 
+
+def _patch_lifecycle_dependencies(monkeypatch, runtime: SimpleNamespace, service_cls: type) -> None:
     monkeypatch.setattr(
         "src.main.config.config_loader.ConfigLoader.load_target_products",
         lambda: ["IF"],
@@ -172,6 +170,17 @@ def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatc
         lambda *args, **kwargs: runtime,
         raising=False,
     )
+
+
+def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatch) -> None:
+    calls: list[str] = []
+    runtime = SimpleNamespace(
+        lifecycle=SimpleNamespace(init_hooks=[]),
+        state=SimpleNamespace(restore_hooks=[lambda entry: calls.append(f"restore:{entry.strategy_name}")]),
+    )
+    service_cls = type("Service", (), {"__init__": lambda self, **kwargs: None})
+    entry = _lifecycle_entry()
+    _patch_lifecycle_dependencies(monkeypatch, runtime, service_cls)
     monkeypatch.setattr(
         LifecycleWorkflow,
         "_sync_live_oms_snapshot",
@@ -181,3 +190,41 @@ def test_lifecycle_on_init_runs_optional_restore_hooks_after_oms_sync(monkeypatc
     LifecycleWorkflow(entry).on_init()
 
     assert calls == ["oms", "restore:demo"]
+
+
+def test_lifecycle_on_init_bulk_loads_warmup_when_indicator_supports_it(monkeypatch) -> None:
+    calls: list[str] = []
+    runtime = SimpleNamespace(
+        lifecycle=SimpleNamespace(init_hooks=[]),
+        state=SimpleNamespace(restore_hooks=[]),
+    )
+    service_cls = type(
+        "Service",
+        (),
+        {"__init__": lambda self, **kwargs: None, "supports_bulk_warmup": True},
+    )
+    frames = {"IF2501.CFFEX": object()}
+
+    def replay_bars_from_database(**kwargs):
+        calls.append("replay")
+        return True
+
+    def load_bars_as_frames(**kwargs):
+        calls.append(f"load:{kwargs['days']}")
+        return frames
+
+    entry = _lifecycle_entry(
+        history_repo=SimpleNamespace(
+            replay_bars_from_database=replay_bars_from_database,
+            load_bars_as_frames=load_bars_as_frames,
+        ),
+        market_workflow=SimpleNamespace(
+            handle_bars_bulk=lambda loaded: calls.append(f"bulk:{loaded is frames}")
+        ),
+    )
+    _patch_lifecycle_dependencies(monkeypatch, runtime, service_cls)
+    monkeypatch.setattr(LifecycleWorkflow, "_sync_live_oms_snapshot", lambda self: None)
+
+    LifecycleWorkflow(entry).on_init()
+
+    assert calls == ["load:1", "bulk:True"]
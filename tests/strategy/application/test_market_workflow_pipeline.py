@@ -149,6 +149,7 @@ def test_market_workflow_emits_decision_trace_for_open_pipeline() -> None:
     entry.decision_journal_limit = 20
     entry.logger = MagicMock()
     entry.current_dt = datetime(2026, 1, 2, 10, 0, 0)
+    entry.warming_up = False
     entry._record_snapshot = lambda: None
     entry._register_signal_temporary_symbol = lambda vt_symbol: None
     entry.last_decision_trace = None
@@ -198,3 +199,79 @@ def test_market_workflow_emits_decision_trace_for_open_pipeline() -> None:
     execution_planner.assert_called_once()
     execution_scheduler.assert_called_once()
     rebalance_planner.assert_called_once()
+
+
+def _load_preset_indicator_service(preset: str, class_name: str):
+    import importlib.util
+    from pathlib import Path
+
+    path = (
+        Path(__file__).resolve().parents[3]
+        / "src" / "main" / "scaffold" / "templates" / "presets" / preset / "indicator_service.py"
+    )
+    spec = importlib.util.spec_from_file_location(f"_preset_{preset.replace('-', '_')}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def _warmup_entry(indicator_service) -> SimpleNamespace:
+    entry = SimpleNamespace()
+    entry.target_aggregate = InstrumentManager()
+    entry.position_aggregate = None
+    entry.indicator_service = indicator_service
+    entry.signal_service = None
+    entry.runtime = SimpleNamespace()
+    entry.observability_config = {"emit_noop_decisions": False}
+    entry.logger = MagicMock()
+    entry.current_dt = None
+    entry.warming_up = True
+    entry.last_decision_trace = None
+    entry._record_snapshot = MagicMock()
+    return entry
+
+
+def test_bulk_warmup_matches_per_bar_replay_for_opted_in_indicator() -> None:
+    import pandas as pd
+
+    service_cls = _load_preset_indicator_service("ema-cross", "EmaCrossIndicatorService")
+    assert service_cls.supports_bulk_warmup is True
+
+    closes = [100.0 + (i % 7) * 0.8 - (i % 3) * 0.5 for i in range(40)]
+    rows = [
+        {
+            "datetime": datetime(2026, 1, 2, 9, 30 + i // 60, i % 60),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": 10,
+        }
+        for i, close in enumerate(closes)
+    ]
+
+    replay_entry = _warmup_entry(service_cls(fast_period=3, slow_period=8))
+    replay_workflow = MarketWorkflow(replay_entry)
+    for row in rows:
+        bar = SimpleNamespace(
+            datetime=row["datetime"],
+            open_price=row["open"],
+            high_price=row["high"],
+            low_price=row["low"],
+            close_price=row["close"],
+            volume=row["volume"],
+        )
+        replay_workflow.process_bars({"IF2506.CFFEX": bar})
+
+    bulk_entry = _warmup_entry(service_cls(fast_period=3, slow_period=8))
+    MarketWorkflow(bulk_entry).handle_bars_bulk({"IF2506.CFFEX": pd.DataFrame(rows)})
+
+    replayed = replay_entry.target_aggregate.get_instrument("IF2506.CFFEX").indicators["ema_cross"]
+    bulk = bulk_entry.target_aggregate.get_instrument("IF2506.CFFEX").indicators["ema_cross"]
+    assert bulk["bar_count"] == replayed["bar_count"] == len(rows)
+    for key in ("fast", "slow", "prev_fast", "prev_slow"):
+        assert abs(bulk[key] - replayed[key]) < 1e-9
+    assert bulk_entry.current_dt == replay_entry.current_dt
+    # 预热期间不记录监控快照
+    replay_entry._record_snapshot.assert_not_called()
+    bulk_entry._record_snapshot.assert_not_called()
@@ -173,3 +173,26 @@ def test_reserved_open_volume_comes_from_execution_state() -> None:
     )
 
     assert aggregate.get_reserved_open_volume(vt_symbol) == 3
+
+
+def test_open_positions_grouped_by_underlying_skip_flat_positions() -> None:
+    aggregate, vt_symbol = _seed_position()
+    flat = aggregate.create_position(
+        option_vt_symbol="IO2506-P-3800.CFFEX",
+        underlying_vt_symbol="IF2506.CFFEX",
+        signal="seed",
+        target_volume=1,
+    )
+    other = aggregate.create_position(
+        option_vt_symbol="MO2506-C-6000.CFFEX",
+        underlying_vt_symbol="IM2506.CFFEX",
+        signal="seed",
+        target_volume=1,
+    )
+    other.volume = 1
+
+    grouped = aggregate.get_open_positions_by_underlying()
+
+    assert [position.vt_symbol for position in grouped["IF2506.CFFEX"]] == [vt_symbol]
+    assert grouped["IM2506.CFFEX"] == [other]
+    assert flat.vt_symbol not in {p.vt_symbol for ps in grouped.values() for p in ps}
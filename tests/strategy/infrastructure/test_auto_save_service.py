@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.strategy.infrastructure.persistence import auto_save_service as auto_save_module
+from src.strategy.infrastructure.persistence.auto_save_service import AutoSaveService
+from src.strategy.infrastructure.persistence.json_serializer import JsonSerializer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(auto_save_module.time, "monotonic", fake)
+    return fake
+
+
+def test_maybe_save_keeps_call_count_when_clock_gate_fails(clock: _Clock) -> None:
+    repository = MagicMock()
+    service = AutoSaveService(
+        state_repository=repository,
+        strategy_name="demo",
+        serializer=JsonSerializer(),
+        interval_seconds=120.0,
+        expected_bar_seconds=60.0,
+    )
+    snapshots = iter({"seq": i} for i in range(10))
+
+    # 第 2 次调用达到计数门槛，但时钟未满一个间隔，不保存
+    clock.now = 60.0
+    service.maybe_save(lambda: next(snapshots))
+    clock.now = 100.0
+    service.maybe_save(lambda: next(snapshots))
+    assert service._pending_future is None
+
+    # 计数保留，时钟到期后的下一次调用即保存，而非再等一个完整计数周期
+    clock.now = 130.0
+    service.maybe_save(lambda: next(snapshots))
+    assert service._pending_future is not None
+    service._pending_future.result(timeout=5)
+    assert repository.save_raw.call_count == 1
+
+    # 提交后计数清零，重新按 N 次调用门控
+    clock.now = 300.0
+    service.maybe_save(lambda: next(snapshots))
+    service.shutdown()
+    assert repository.save_raw.call_count == 1
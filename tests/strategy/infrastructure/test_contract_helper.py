@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.strategy.infrastructure.parsing.contract_helper import ContractHelper
+
+
+def _option(strike: int, option_type: str = "call") -> SimpleNamespace:
+    side = "C" if option_type == "call" else "P"
+    symbol = f"IO2506-{side}-{strike}"
+    return SimpleNamespace(
+        symbol=symbol,
+        vt_symbol=f"{symbol}.CFFEX",
+        exchange=SimpleNamespace(value="CFFEX"),
+        option_type=option_type,
+        option_strike=strike,
+        option_underlying="IF2506",
+        option_expiry="2025-06-20",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    ContractHelper.invalidate_cache()
+    yield
+    ContractHelper.invalidate_cache()
+
+
+def test_option_chain_reflects_repushed_contract() -> None:
+    contracts = [_option(3700), _option(3800), _option(3900, "put")]
+    first = ContractHelper.get_option_chain(contracts, "IF2506.CFFEX")
+
+    repushed = list(contracts)
+    repushed[1] = _option(3850)
+    chain = ContractHelper.get_option_chain(repushed, "IF2506.CFFEX")
+    vt_symbols = ContractHelper.get_option_vt_symbols(repushed, "IF2506.CFFEX")
+
+    assert list(first["strike_price"]) == [3700, 3800, 3900]
+    assert list(chain["strike_price"]) == [3700, 3850, 3900]
+    assert list(chain["vt_symbol"]) == vt_symbols
+    assert list(chain["option_type"]) == ["call", "call", "put"]
+
+
+def test_product_index_refreshes_when_middle_contract_is_repushed() -> None:
+    first = SimpleNamespace(symbol="rb2501")
+    middle = SimpleNamespace(symbol="hc2501")
+    last = SimpleNamespace(symbol="rb2505")
+    contracts = [first, middle, last]
+
+    index = ContractHelper.build_product_index(contracts)
+    assert ContractHelper.build_product_index(list(contracts)) is index
+
+    # 网关重推中间合约: 首尾与长度不变，仍需返回新对象
+    repushed = SimpleNamespace(symbol="hc2501")
+    refreshed = ContractHelper.build_product_index([first, repushed, last])
+    assert refreshed is not index
+    assert refreshed["hc"] == (repushed,)
+    assert refreshed["rb"] == (first, last)
+
+    # 共享缓存只读，调用方无法就地修改
+    with pytest.raises(TypeError):
+        refreshed["hc"] = ()
+
+    ContractHelper.invalidate_cache()
+    assert ContractHelper.build_product_index([first, repushed, last]) is not refreshed
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.strategy.infrastructure.persistence.json_serializer import JsonSerializer
+from src.strategy.infrastructure.persistence.state_repository import StateRepository
+
+
+def _repository(serializer: JsonSerializer, stored: dict) -> StateRepository:
+    repository = StateRepository(
+        serializer=serializer,
+        database_factory=MagicMock(),
+        compression_threshold=64,
+    )
+    repository._select_latest_snapshot = lambda strategy_name: stored.get(strategy_name)
+    return repository
+
+
+def test_load_passes_decompressed_bytes_straight_to_deserializer() -> None:
+    serializer = JsonSerializer()
+    data = {
+        "current_dt": datetime(2026, 1, 2, 10, 0, 0),
+        "notes": ["快照"] * 200,
+    }
+    stored, compressed = StateRepository(
+        serializer=serializer,
+        database_factory=MagicMock(),
+        compression_threshold=64,
+    )._maybe_compress(serializer.serialize(data))
+    assert compressed
+
+    seen_types: list = []
+    original = serializer.deserialize
+
+    def spy(json_str):
+        seen_types.append(type(json_str))
+        return original(json_str)
+
+    serializer.deserialize = spy
+    repository = _repository(serializer, {"demo": stored})
+
+    loaded = repository.load("demo")
+
+    assert seen_types == [bytes]
+    assert loaded["current_dt"] == data["current_dt"]
+    assert loaded["notes"] == data["notes"]
+    assert repository.verify_integrity("demo") is True
+
+
+def test_load_keeps_uncompressed_payload_as_str() -> None:
+    serializer = JsonSerializer()
+    stored = serializer.serialize({"value": 1})
+    repository = _repository(serializer, {"demo": stored})
+
+    assert repository._maybe_decompress(stored) is stored
+    assert repository.load("demo")["value"] == 1
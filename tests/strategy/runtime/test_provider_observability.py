@@ -31,6 +31,70 @@ def test_state_workflow_writes_to_runtime_snapshot_sinks() -> None:
     )
 
 
+def test_state_workflow_throttles_snapshots_unless_forced() -> None:
+    sink = MagicMock()
+    entry = SimpleNamespace(
+        runtime=SimpleNamespace(state=SimpleNamespace(snapshot_sinks=[sink])),
+        target_aggregate=MagicMock(),
+        position_aggregate=MagicMock(),
+        logger=MagicMock(),
+        snapshot_interval_sec=3600.0,
+    )
+    workflow = StateWorkflow(entry)
+
+    workflow.record_snapshot()
+    workflow.record_snapshot()
+    assert sink.call_count == 1
+
+    workflow.record_snapshot(force=True)
+    assert sink.call_count == 2
+
+
+def test_event_bridge_forces_snapshot_on_position_change() -> None:
+    from src.strategy.application.event_bridge import EventBridge
+
+    position_aggregate = MagicMock()
+    entry = SimpleNamespace(
+        position_aggregate=position_aggregate,
+        combination_aggregate=None,
+        _publish_domain_events=MagicMock(),
+        _reconcile_subscriptions=MagicMock(),
+        _record_snapshot=MagicMock(),
+    )
+    bridge = EventBridge(entry)
+    position = SimpleNamespace(
+        vt_symbol="IO2506-C-3800.CFFEX",
+        direction="long",
+        volume=1,
+        frozen=0,
+        price=10.0,
+        pnl=0.0,
+    )
+
+    # 周期性持仓推送无变化时不打断节流
+    position_aggregate.has_pending_events.return_value = False
+    bridge.on_position(position)
+    entry._record_snapshot.assert_not_called()
+
+    position_aggregate.has_pending_events.return_value = True
+    bridge.on_position(position)
+    entry._record_snapshot.assert_called_once_with(force=True)
+
+    position_aggregate.is_managed.return_value = True
+    trade = SimpleNamespace(
+        vt_tradeid="t1",
+        vt_orderid="o1",
+        vt_symbol="IO2506-C-3800.CFFEX",
+        direction="long",
+        offset="open",
+        price=10.0,
+        volume=1,
+        datetime=None,
+    )
+    bridge.on_trade(trade)
+    assert entry._record_snapshot.call_count == 2
+
+
 def test_monitoring_provider_contributes_snapshot_and_trace_sinks() -> None:
     from src.strategy.runtime.providers.monitoring import PROVIDER
 